@@ -5,11 +5,50 @@ This package contains various config
 modules for DDT.
 """
 
-from .constants import *
-from .point_mapping import *
-from .ui_config import *
-from .chart_config import *
-from .incident_config import *
+from . import constants
+from .constants import (
+    APP_NAME,
+    APP_VERSION,
+    APP_TITLE,
+    CSV_TITLE,
+    CSV_HEADERS,
+    CSV_FLOAT_FORMAT,
+    DATA_FOLDER_NAME,
+    TIME_ZONE_OFFSET_ID,
+    STRICT_MODE,
+)
+from .point_mapping import (
+    IO_POINTS,
+    VFD_POINTS,
+    IO_TYPES,
+    GRAPH_PRESETS,
+    PRESET_IO_POINTS,
+    PRESET_VFD_POINTS,
+)
+from .ui_config import (
+    APP_APPEARANCE,
+    UI_COMPONENTS,
+    COMPONENT_DIMENSIONS,
+    UI_PADDING,
+    UI_FONTS,
+    UI_COLORS,
+)
+from .chart_config import CHART_COLORS, LINE_WIDTH, ASTERICK_SIZE
+from .incident_config import (
+    INCIDENT_TYPE,
+    INCIDENT_STATE,
+    INCIDENT_COLORS,
+    INCIDENT_ARGUMENTS,
+    INCIDENT_COLOR_TABLE,
+    IncidentColor,
+)
+
+
+def __getattr__(name):
+    """Defer filesystem and screen lookups until the value is needed."""
+    if name in ("DATA_FOLDER_HOME", "DATA_FOLDER_PATH", "SCREENSIZE"):
+        return getattr(constants, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -18,16 +57,19 @@ __all__ = [
     "APP_TITLE",
     "CSV_TITLE",
     "CSV_HEADERS",
+    "CSV_FLOAT_FORMAT",
     "DATA_FOLDER_NAME",
     "DATA_FOLDER_HOME",
     "DATA_FOLDER_PATH",
-    "BATCH_SIZE",
     "SCREENSIZE",
     "TIME_ZONE_OFFSET_ID",
+    "STRICT_MODE",
     "IO_POINTS",
     "VFD_POINTS",
     "IO_TYPES",
     "GRAPH_PRESETS",
+    "PRESET_IO_POINTS",
+    "PRESET_VFD_POINTS",
     "APP_APPEARANCE",
     "UI_COMPONENTS",
     "COMPONENT_DIMENSIONS",
@@ -41,4 +83,6 @@ __all__ = [
     "INCIDENT_STATE",
     "INCIDENT_COLORS",
     "INCIDENT_ARGUMENTS",
+    "INCIDENT_COLOR_TABLE",
+    "IncidentColor",
 ]
@@ -1,6 +1,9 @@
 """Bokeh chart configuration module."""
 
-CHART_COLORS = [
+from itertools import cycle
+from typing import Iterator
+
+CHART_COLORS = (
     "magenta",
     "lime",
     "aqua",
@@ -19,7 +22,17 @@ CHART_COLORS = [
     "maroon",
     "lightyellow",
     "lavender",
-]
+)
 
 LINE_WIDTH = 2
 ASTERICK_SIZE = 7
+
+
+def chart_color_iter() -> Iterator[str]:
+    """
+    Get a fresh iterator that repeats the chart palette.
+
+    Returns:
+        Iterator[str]: Endless cycle over CHART_COLORS
+    """
+    return cycle(CHART_COLORS)
@@ -1,7 +1,10 @@
 """Configuration constants for FB2 DDT."""
 
 import os
+import sys
 import ctypes
+from functools import lru_cache
+from itertools import count
 from pathlib import Path
 
 
@@ -12,32 +15,88 @@ APP_TITLE = "DDT"
 
 # CSV file
 CSV_TITLE = "data.csv"
-CSV_HEADERS = ["Preset Name", "Point Name", "Timestamp", "Value"]
+CSV_HEADERS = ("Preset Name", "Point Name", "Timestamp", "Value")
+
+# printf-style format for float values in the CSV, None writes them in full.
+# Only the exported file is rounded; the database keeps full precision.
+CSV_FLOAT_FORMAT = "%.6g"
 
 # Data extraction folder name
 DATA_FOLDER_NAME = "data"
 
-# Home for data folder
-_home = Path.home()
-DATA_FOLDER_HOME = str(_home / "Documents" / "DDT")
+# Set DDT_STRICT=1 to re-raise database errors instead of logging them
+STRICT_MODE = os.environ.get("DDT_STRICT", "0") not in ("", "0")
 
-# Create new folder if folder exists
-DATA_FOLDER_PATH = os.path.join(DATA_FOLDER_HOME, DATA_FOLDER_NAME)
-_temp_data_folder_path = DATA_FOLDER_PATH
-_counter = 1
-while os.path.exists(DATA_FOLDER_PATH):
-    DATA_FOLDER_PATH = f"{_temp_data_folder_path}({_counter})"
-    _counter += 1
+# Time Zone Offset parNameTidx
+TIME_ZONE_OFFSET_ID = 120184
 
-# File batching size
-BATCH_SIZE = 9
+# Screen resolution used when the system can't be queried
+DEFAULT_SCREEN_RESOLUTION = (1920, 1080)
 
-# Screen size
-_user32 = ctypes.windll.user32
-_screensize = _user32.GetSystemMetrics(0), _user32.GetSystemMetrics(
-    1
-)  # SM_CXSCREEN, SM_CYSCREEN
-SCREENSIZE = [int(_screensize[0] * 0.9895883), int(_screensize[1] * 0.775)]
 
-# Time Zone Offset parNameTidx
-TIME_ZONE_OFFSET_ID = 120184
+@lru_cache(maxsize=1)
+def get_data_folder_home() -> str:
+    """
+    Get the home directory for data folders.
+
+    Returns:
+        str: Documents/DDT under the user's home directory
+    """
+    return str(Path.home() / "Documents" / "DDT")
+
+
+@lru_cache(maxsize=1)
+def get_data_folder_path() -> str:
+    """
+    Get the data folder path for this run.
+
+    Resolved once per process so every module sees the same folder.
+
+    Returns:
+        str: Data folder path, with (number) appended if the folder exists
+    """
+    # One directory read instead of a stat per candidate name
+    try:
+        with os.scandir(get_data_folder_home()) as entries:
+            existing = {entry.name for entry in entries}
+    except FileNotFoundError:
+        existing = set()
+
+    if DATA_FOLDER_NAME in existing:
+        folder_name = next(
+            name
+            for name in (f"{DATA_FOLDER_NAME}({i})" for i in count(1))
+            if name not in existing
+        )
+    else:
+        folder_name = DATA_FOLDER_NAME
+    return os.path.join(get_data_folder_home(), folder_name)
+
+
+@lru_cache(maxsize=1)
+def get_screensize() -> list:
+    """
+    Get the plot size derived from the primary screen resolution.
+
+    Returns:
+        list: [width, height] in pixels
+    """
+    if sys.platform == "win32":
+        user32 = ctypes.windll.user32
+        screensize = user32.GetSystemMetrics(0), user32.GetSystemMetrics(
+            1
+        )  # SM_CXSCREEN, SM_CYSCREEN
+    else:
+        screensize = DEFAULT_SCREEN_RESOLUTION
+    return [int(screensize[0] * 0.9895883), int(screensize[1] * 0.775)]
+
+
+def __getattr__(name):
+    """Resolve side-effectful constants only when they are first read."""
+    if name == "DATA_FOLDER_HOME":
+        return get_data_folder_home()
+    if name == "DATA_FOLDER_PATH":
+        return get_data_folder_path()
+    if name == "SCREENSIZE":
+        return get_screensize()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
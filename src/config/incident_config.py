@@ -1,27 +1,54 @@
 """Incident configurations."""
 
-INCIDENT_TYPE = {
-    "event": "J_INCIDENT_EVENT",
-    "warning": "J_INCIDENT_WARNING",
-    "alarm": "J_INCIDENT_ALARM",
-}
-
-INCIDENT_STATE = {
-    "one_shot": "J_INCIDENT_ONE_SHOT",
-    "set": "J_INCIDENT_SET",
-    "clear": "J_INCIDENT_CLEAR",
-}
-
-INCIDENT_ARGUMENTS = {
-    "d": "longValue",
-    "s": "stringTidxValue",
-    "f": "realValue",
-}
-
-INCIDENT_COLORS = {
-    "clear": "#77797d",
-    "event": "#05e81b",
-    "warning": "#e88605",
-    "alarm": "#e80505",
-    "black_text": "#000000",
-}
+from enum import IntEnum
+from types import MappingProxyType
+
+INCIDENT_TYPE = MappingProxyType(
+    {
+        "event": "J_INCIDENT_EVENT",
+        "warning": "J_INCIDENT_WARNING",
+        "alarm": "J_INCIDENT_ALARM",
+    }
+)
+
+INCIDENT_STATE = MappingProxyType(
+    {
+        "one_shot": "J_INCIDENT_ONE_SHOT",
+        "set": "J_INCIDENT_SET",
+        "clear": "J_INCIDENT_CLEAR",
+    }
+)
+
+INCIDENT_ARGUMENTS = MappingProxyType(
+    {
+        "d": "longValue",
+        "s": "stringTidxValue",
+        "f": "realValue",
+    }
+)
+
+INCIDENT_COLORS = MappingProxyType(
+    {
+        "clear": "#77797d",
+        "event": "#05e81b",
+        "warning": "#e88605",
+        "alarm": "#e80505",
+        "black_text": "#000000",
+    }
+)
+
+
+class IncidentColor(IntEnum):
+    """Index of each color in INCIDENT_COLOR_TABLE."""
+
+    CLEAR = 0
+    EVENT = 1
+    WARNING = 2
+    ALARM = 3
+    BLACK_TEXT = 4
+
+
+# INCIDENT_COLORS ordered by IncidentColor for index lookups
+INCIDENT_COLOR_TABLE = tuple(
+    INCIDENT_COLORS[color.name.lower()] for color in IncidentColor
+)
@@ -241,3 +241,13 @@ GRAPH_PRESETS = {
         "VFDActSpeed",
     ],
 }
+
+# Preset points split by the table they are read from, resolved once at import
+PRESET_IO_POINTS = {
+    preset: [point for point in points if point not in VFD_POINTS]
+    for preset, points in GRAPH_PRESETS.items()
+}
+PRESET_VFD_POINTS = {
+    preset: [point for point in points if point in VFD_POINTS]
+    for preset, points in GRAPH_PRESETS.items()
+}
@@ -7,7 +7,18 @@ and workflow modules for DDT.
 - WorkflowManager
 """
 
-from .application_controller import ApplicationController
-from .workflow_manager import WorkflowManager
+
+def __getattr__(name):
+    """Import submodules on first access so importing core stays cheap."""
+    if name == "ApplicationController":
+        from .application_controller import ApplicationController
+
+        return ApplicationController
+    if name == "WorkflowManager":
+        from .workflow_manager import WorkflowManager
+
+        return WorkflowManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["ApplicationController", "WorkflowManager"]
@@ -1,62 +1,83 @@
 """Application controller that coordinates UI and business logic."""
 
+import atexit
+import logging
 import threading
-import gc
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
 
-from config.constants import DATA_FOLDER_PATH, DATA_FOLDER_HOME
-from core.workflow_manager import WorkflowManager
-from data.database_manager import DatabaseManager
-from ui.screen.main_window import MainWindow
-from util.file_util import cleanup_data_directory, create_folder, get_xml_file
+from config.constants import get_data_folder_path, get_data_folder_home
+
+logger = logging.getLogger(__name__)
+
+# Seconds the report job waits for another job to finish loading files
+FILE_READY_TIMEOUT = 300
+
+# Shown when the selected files no longer match the merge in the data folder
+STALE_MERGE_MESSAGE = (
+    "Selected files changed; delete data folder contents to reload them."
+)
 
 
 class ApplicationController:
     """Main application controller that coordinates UI and buisness logic."""
 
     def __init__(self):
+        # Deferred so importing the controller doesn't pull in the DB/Bokeh stack
+        from core.workflow_manager import WorkflowManager
+        from data.database_manager import DatabaseManager
+
         self.main_window = None
         self.database_manager = DatabaseManager()
         self.workflow_manager = WorkflowManager(self.database_manager)
         self.merged_file = None
+        self._merged_key = None  # (path, mtime_ns, size) of the merged inputs
         self.file_ready_event = threading.Event()
 
+        # Shared workers for UI-triggered jobs; the lock guards merged_file.
+        # Exit still joins running jobs, so every wait inside a job is bounded;
+        # the atexit hook only drops jobs that haven't started
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="DDT")
+        self._merged_lock = threading.Lock()
+        atexit.register(self._executor.shutdown, wait=False, cancel_futures=True)
+
+        # Worker status updates, applied on the Tk thread by _drain_status_queue
+        self._status_q: queue.Queue[tuple[str, float]] = queue.Queue()
+
+        # One run per job type; repeat clicks are rejected while busy
+        self._graph_busy = threading.Lock()
+        self._incidents_busy = threading.Lock()
+        self._report_busy = threading.Lock()
+
     def start_application(self) -> None:
         """Start the main application"""
         try:
+            # Deferred so importing the controller doesn't pull in Tk
+            from ui.screen.main_window import MainWindow
+            from util.file_util import create_folder
+
             # Create data folder
-            create_folder(DATA_FOLDER_PATH)
+            create_folder(get_data_folder_path())
 
             # Create main window
-            print("DEBUG: Creating MainWindow()")
+            logger.debug("Creating MainWindow()")
             self.main_window = MainWindow()
-            print("DEBUG: MainWindow created")
+            logger.debug("MainWindow created")
 
             # Set up UI callbacks
             self.setup_ui_callbacks()
-            print("DEBUG: UI callbacks set up")
+            self._drain_status_queue()
+            logger.debug("UI callbacks set up")
 
             # Start main loop
-            print("DEBUG: Entering Tk mainloop")
+            logger.debug("Entering Tk mainloop")
             self.main_window.run()
-            print("DEBUG: Tk mainloop exited")
+            logger.debug("Tk mainloop exited")
 
         except Exception as e:
             # Do NOT swallow startup errors; write a log so packaged exe isn't silent
-            try:
-                import os, traceback
-                from util.file_util import ensure_directory_exists
-
-                ensure_directory_exists(DATA_FOLDER_HOME)
-                log_path = os.path.join(DATA_FOLDER_HOME, "startup_error.log")
-                with open(log_path, "w", encoding="utf-8") as f:
-                    f.write("DDT failed to start due to an exception.\n\n")
-                    traceback.print_exc(file=f)
-                    f.write("\nMessage: " + str(e) + "\n")
-                # Best-effort user hint via console if available
-                print(f"Startup error written to: {log_path}")
-            except Exception:
-                # If even logging fails, re-raise so outer handler can capture
-                pass
+            _write_startup_error(e, "DDT failed to start due to an exception.\n\n", "w")
             # Re-raise to let outer handler report/exit appropriately
             raise
 
@@ -127,15 +148,12 @@ class ApplicationController:
 
             # Close WorkflowManager connections
             if self.workflow_manager:
-                if hasattr(self.workflow_manager, "close_database_connections"):
-                    self.workflow_manager.close_database_connections()
+                self.workflow_manager.close_database_connections()
 
             # Close any direct connections
-            if hasattr(self, "database_manager") and self.database_manager:
+            if self.database_manager:
                 self.database_manager.close()
 
-            gc.collect()
-
             pass
         except Exception as e:
             pass
@@ -143,11 +161,12 @@ class ApplicationController:
     def on_database_deleted(self) -> None:
         """Handle deletion of main database."""
 
-        self.merged_file = None
+        with self._merged_lock:
+            self.merged_file = None
+            self._merged_key = None
 
         if self.workflow_manager:
-            if hasattr(self.workflow_manager, "clear_cached_data"):
-                self.workflow_manager.clear_cached_data()
+            self.workflow_manager.clear_cached_data()
 
     def on_cleared_custom_points(self, count: int) -> None:
         """Handle cleared custom points event."""
@@ -173,14 +192,13 @@ class ApplicationController:
         """Handle graph generation request with collected parameters."""
 
         try:
+            if not self._graph_busy.acquire(blocking=False):
+                self.main_window.update_status("Already generating graphs...")
+                return
             self.file_ready_event.clear()
-            thread = threading.Thread(
-                target=self._generate_graphs_background,
-                args=(params,),
-                name="GraphGeneration",
+            self._submit_gated(
+                self._graph_busy, self._generate_graphs_background, params
             )
-            thread.daemon = True
-            thread.start()
         except Exception as e:
             self.main_window.update_status(f"Error: {e}")
 
@@ -188,13 +206,12 @@ class ApplicationController:
         """Handle incident population request."""
 
         try:
-            thread = threading.Thread(
-                target=self._populate_incidents_background,
-                args=(params,),
-                name="IncidentPopulation",
+            if not self._incidents_busy.acquire(blocking=False):
+                self.main_window.update_status("Already populating incidents...")
+                return
+            self._submit_gated(
+                self._incidents_busy, self._populate_incidents_background, params
             )
-            thread.daemon = True
-            thread.start()
         except Exception as e:
             self.main_window.update_status(f"Error: {e}")
 
@@ -202,33 +219,91 @@ class ApplicationController:
         """Handle populate request from incident viewer screen."""
 
         try:
+            if not self._report_busy.acquire(blocking=False):
+                self.main_window.update_status("Already populating report...")
+                return
             self.file_ready_event.clear()
-            thread = threading.Thread(
-                target=self._populate_report_background,
-                args=(params,),
-                name="ReportPopulation",
+            self._submit_gated(
+                self._report_busy, self._populate_report_background, params
             )
-            thread.daemon = True
-            thread.start()
         except Exception as e:
             self.main_window.update_status(f"Error: {e}")
 
+    def _submit_gated(
+        self, gate: threading.Lock, job: Callable[[dict], None], params: dict
+    ) -> None:
+        """
+        Submit a job to the worker pool, releasing its gate when it finishes.
+
+        Parameters:
+            gate (threading.Lock): Already-acquired lock marking the job as busy
+            job (Callable[[dict], None]): Background method to run
+            params (dict): Parameters passed to the job
+        """
+
+        def run() -> None:
+            try:
+                job(params)
+            finally:
+                gate.release()
+
+        try:
+            future = self._executor.submit(run)
+        except Exception:
+            gate.release()
+            raise
+        future.add_done_callback(self._report_job_failure)
+
+    def _report_job_failure(self, future: Future) -> None:
+        """
+        Log and show the error of a background job that raised.
+
+        Parameters:
+            future (Future): Finished job
+        """
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if error is not None:
+            logger.error("Background job failed", exc_info=error)
+            self._update_ui_safe(f"Error: {error}", 0)
+
     def _generate_graphs_background(self, params: dict) -> None:
         """Background thread for graph generation."""
+        from util.file_util import cleanup_data_directory
+
         try:
             # Check if file has previously been created
-            if self.merged_file is None:
-                # Stage 1: File loading (20% progress)
-                self._update_ui_safe("Loading files...", 0.1)
-                if params["files"]:
-                    self.merged_file = self.workflow_manager.load_files(params["files"])
-                    self.file_ready_event.set()
-                    self.workflow_manager.set_time_zone_offset(None)
-
-                else:
-                    self._update_ui_safe("No files selected on Home screen.", 0)
-                    self.main_window.enable_graphing_btns()
-                    return
+            key = _file_signature(params["files"])
+            with self._merged_lock:
+                if self.merged_file is None:
+                    # Stage 1: File loading (20% progress)
+                    self._update_ui_safe("Loading files...", 0.1)
+                    if params["files"]:
+                        try:
+                            self.merged_file = self.workflow_manager.load_files(
+                                params["files"]
+                            )
+                            self._merged_key = key
+                        finally:
+                            # Release report waiters even if loading failed
+                            self.file_ready_event.set()
+                        self.workflow_manager.set_time_zone_offset(None)
+
+                    else:
+                        self._update_ui_safe("No files selected on Home screen.", 0)
+                        self.main_window.enable_graphing_btns()
+                        return
+
+                merged_key = self._merged_key
+
+            # Only one merge fits in the data folder, so changed inputs can't
+            # be loaded alongside it; don't plot the old merge as if it were them
+            if params["files"] and key != merged_key:
+                self._update_ui_safe(STALE_MERGE_MESSAGE, 0)
+                self.main_window.enable_graphing_btns()
+                return
 
             # Check if file loaded
             if self.merged_file != "":
@@ -251,17 +326,39 @@ class ApplicationController:
                 self.main_window.enable_graphing_btns()
                 return
 
-            # Stage 3: Generate CSV (optional 60% progess)
+            # Stage 3: Generate CSV (optional 60% progess), written alongside
+            # the plots since the two don't depend on each other
+            csv_executor = None
+            csv_future = None
             if params["include_csv"] is True:
                 self._update_ui_safe("Generating CSV File...", 0.5)
-                self.workflow_manager.generate_csv(processed_data)
-                self._update_ui_safe("CSV Generated", 0.6)
+                csv_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="DDT-CSV"
+                )
+                csv_future = csv_executor.submit(
+                    self.workflow_manager.generate_csv, processed_data
+                )
 
             # Stage 4: Graph data to Bokeh plots (80% progress)
-            self._update_ui_safe("Creating plots...", 0.7)
-            self.workflow_manager.generate_graphs(
-                processed_data, params["jna_current_limit"], params["cutter_amp_limit"]
-            )
+            try:
+                self._update_ui_safe("Creating plots...", 0.7)
+
+                # GraphGenerator adds a "Custom" entry to the preset dict, so
+                # give it its own copy while the CSV reads the original
+                graph_data = {
+                    **processed_data,
+                    "preset": dict(processed_data["preset"]),
+                }
+                self.workflow_manager.generate_graphs(
+                    graph_data, params["jna_current_limit"], params["cutter_amp_limit"]
+                )
+
+                if csv_future is not None:
+                    csv_future.result()
+                    self._update_ui_safe("CSV Generated", 0.75)
+            finally:
+                if csv_executor is not None:
+                    csv_executor.shutdown(wait=True)
             self._update_ui_safe("Plots generated...", 0.8)
 
             # Stage 5: Clean up directory (100% progress)
@@ -277,16 +374,36 @@ class ApplicationController:
 
     def _populate_incidents_background(self, params: dict) -> None:
         """Background thread for incident population."""
+        try:
+            self._populate_incidents(params)
+        finally:
+            # Report jobs wait on the offset; hand them whatever is known,
+            # also when there is no text dictionary or processing failed
+            self.workflow_manager.set_timezone_offset_ready()
+
+    def _populate_incidents(self, params: dict) -> None:
+        """Load the files if needed, then process and render incidents."""
+        from util.file_util import get_xml_file
 
         # Check if file has previously been created
-        if self.merged_file is None:
-            # Stage 1: File loading (20% progress)
-            self._update_ui_safe("Loading files...", 0.1)
-            self.merged_file = self.workflow_manager.load_files(params["files"])
+        key = _file_signature(params["files"])
+        try:
+            with self._merged_lock:
+                if self.merged_file is None:
+                    # Stage 1: File loading (20% progress)
+                    self._update_ui_safe("Loading files...", 0.1)
+                    self.merged_file = self.workflow_manager.load_files(params["files"])
+                    self._merged_key = key
 
-            self.workflow_manager.set_time_zone_offset(None)
+                    self.workflow_manager.set_time_zone_offset(None)
+                merged_key = self._merged_key
+        finally:
+            # Release report waiters even if loading failed
+            self.file_ready_event.set()
 
-        self.file_ready_event.set()
+        if params["files"] and key != merged_key:
+            self._update_ui_safe(STALE_MERGE_MESSAGE, 0)
+            return
 
         # Check if text dictionary exists
         if get_xml_file() is not None:
@@ -308,7 +425,18 @@ class ApplicationController:
         """Background thread for report population."""
 
         if not self.merged_file:
-            self.file_ready_event.wait()  # Block until file creation
+            # Block until file creation
+            if not self.file_ready_event.wait(timeout=FILE_READY_TIMEOUT):
+                self._update_ui_safe("Timed out waiting for file load", 0)
+                return
+
+            if not self.merged_file:
+                self._update_ui_safe("Failed to load merged file", 0)
+                return
+
+        if params["files"] and _file_signature(params["files"]) != self._merged_key:
+            self._update_ui_safe(STALE_MERGE_MESSAGE, 0)
+            return
 
         self.workflow_manager.populate_report(params)
 
@@ -321,11 +449,73 @@ class ApplicationController:
             progress (float): Value from 0 - 1 to set progress bar
         """
 
-        def update():
+        self._status_q.put((message, progress))
+
+    def _drain_status_queue(self) -> None:
+        """Apply the latest queued status update, then poll again."""
+        latest = None
+        try:
+            while True:
+                latest = self._status_q.get_nowait()
+        except queue.Empty:
+            pass
+
+        # Only the newest update is painted; intermediate ones are superseded
+        if latest is not None:
+            message, progress = latest
             self.main_window.update_status(message)
             self.main_window.update_progress(progress)
 
-        self.main_window.root.after(0, update)
+        self.main_window.root.after(50, self._drain_status_queue)
+
+
+def _file_signature(file_paths: list) -> tuple:
+    """
+    Build a key identifying the current contents of a set of input files.
+
+    Parameters:
+        file_paths (list): Selected files
+
+    Returns:
+        tuple: (path, mtime_ns, size) per file, with None for unreadable files
+    """
+    import os
+
+    signature = []
+    for path in file_paths:
+        try:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+
+def _write_startup_error(error: Exception, header: str, mode: str) -> None:
+    """
+    Write the active exception to the startup error log.
+
+    Parameters:
+        error (Exception): Exception being handled
+        header (str): Text written before the traceback
+        mode (str): File mode, "w" to overwrite or "a" to append
+    """
+    try:
+        import os, traceback
+        from util.file_util import ensure_directory_exists
+
+        home = get_data_folder_home()
+        ensure_directory_exists(home)
+        log_path = os.path.join(home, "startup_error.log")
+        with open(log_path, mode, encoding="utf-8") as f:
+            f.write(header)
+            traceback.print_exc(file=f)
+            f.write("\nMessage: " + str(error) + "\n")
+        # Best-effort user hint via console if available
+        print(f"Startup error written to: {log_path}")
+    except Exception:
+        # Logging is best-effort; callers re-raise the original error
+        pass
 
 
 def create_application() -> ApplicationController:
@@ -345,18 +535,6 @@ def run_application() -> None:
         app.start_application()
     except Exception as e:
         # Log to user's Documents/DDT for visibility in both dev and packaged exe
-        try:
-            import os, traceback
-            from util.file_util import ensure_directory_exists
-
-            ensure_directory_exists(DATA_FOLDER_HOME)
-            log_path = os.path.join(DATA_FOLDER_HOME, "startup_error.log")
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write("\n=== Application start failure ===\n")
-                traceback.print_exc(file=f)
-                f.write("\nMessage: " + str(e) + "\n")
-            print(f"Startup error written to: {log_path}")
-        except Exception:
-            pass
+        _write_startup_error(e, "\n=== Application start failure ===\n", "a")
         # Re-raise so a console build also shows the error
         raise
@@ -1,12 +1,21 @@
 """Main application workflow and logic."""
 
+import logging
 import os
+import sqlite3
+from itertools import takewhile
 from typing import List, Dict, Optional
 import threading
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
 
-from config.point_mapping import VFD_POINTS, GRAPH_PRESETS
-from config.constants import DATA_FOLDER_PATH
-from data.database_manager import DatabaseManager
+from config.point_mapping import (
+    VFD_POINTS,
+    GRAPH_PRESETS,
+    PRESET_IO_POINTS,
+    PRESET_VFD_POINTS,
+)
+from config.constants import STRICT_MODE, get_data_folder_path
+from data.database_manager import DatabaseManager, READ_POOL_SIZE
 from data.selected_data_manager import SelectedDataManager
 from data.incident_manager import IncidentManager
 from data.csv_generator import CSVGenerator
@@ -23,6 +32,11 @@ from util.time_util import (
 )
 from viz.graph_generator import GraphGenerator
 
+logger = logging.getLogger(__name__)
+
+# Seconds the report waits for incident processing to settle the offset
+TIME_ZONE_WAIT_TIMEOUT = 300
+
 
 class WorkflowManager:
     """Manages the main data processing workflow."""
@@ -33,7 +47,13 @@ class WorkflowManager:
             self.database_manager = database_manager
 
         self.time_zone_offset = None
-        self.timezone_ready = threading.Event()
+
+        # Resolved with the offset (or None) once incident processing settles it
+        self._tz_future: Future = Future()
+
+        # Set once the database has been asked for the offset, found or not
+        self._tz_checked = False
+        self._tz_lock = threading.Lock()
 
     def load_files(self, file_paths: list) -> str:
         """
@@ -53,7 +73,10 @@ class WorkflowManager:
         success = merge_database_files(get_database_filepaths())
 
         if success:
-            return os.path.join(DATA_FOLDER_PATH, "merged_db.sqlite")
+            # Index the fresh merge once so every later point query can seek
+            if self.database_manager.database_exists():
+                self.database_manager.ensure_indexes()
+            return os.path.join(get_data_folder_path(), "merged_db.sqlite")
         else:
             return ""
 
@@ -66,159 +89,161 @@ class WorkflowManager:
         # ( ex. io: {}, vfd : {}, preset : {})
         selected_data_manager = SelectedDataManager()
 
-        # User selected IO Points
-        if io_points:
-            try:
-
-                io_point_info = (
-                    {}
-                )  # io_point: {ioid: "", iotype: "", ioname: "", active: ""}
-
-                # Get IO Point info
-                for io_point in io_points:
-
-                    # Retrieve data from IOConfig@0
-                    io_point_info[io_point] = self.database_manager.get_io_point_info(
-                        io_point
-                    )
-
-                    if io_point_info[io_point]["active"] == 0:
-                        continue  # IO point is not active
-
-                    else:
-                        # Retrieve data from corresponding table
-                        timestamp_value_list_io = (
-                            self.database_manager.get_io_point_value(
-                                io_point_info[io_point]["io_id"],
-                                io_point_info[io_point]["io_type"],
-                            )
+        try:
+            # One read transaction serves the point info lookups
+            with self.database_manager.read_transaction():
+                # Every IO/VFD point named by the selections and presets
+                requested_io = [
+                    point for point in io_points if point not in VFD_POINTS
+                ] + [
+                    point
+                    for preset in graph_presets
+                    for point in PRESET_IO_POINTS[preset]
+                ]
+                requested_vfd = vfd_points + [
+                    point
+                    for preset in graph_presets
+                    for point in PRESET_VFD_POINTS[preset]
+                ]
+
+                # Retrieve info for active points from IOConfig@0 and
+                # VFDConfig@0 in one query each
+                point_info = {}
+                if requested_io:
+                    point_info.update(
+                        self.database_manager.get_io_point_infos(
+                            requested_io, active_only=True
                         )
-
-                        # Add to data dictionary
-                        selected_data_manager.add_point(
-                            io_point, timestamp_value_list_io
+                    )
+                if requested_vfd:
+                    point_info.update(
+                        self.database_manager.get_vfd_point_infos(
+                            requested_vfd, active_only=True
                         )
-
-            except Exception as e:
-                pass
-
-        if vfd_points:
-            try:
-
-                vfd_point_info = {}  # vfd_readable_name: {vfdId: "", active: ""}
-
-                # Get VFD Point info
-                for vfd_point in vfd_points:
-
-                    # Retrieve data from VFDConfig@0
-                    vfd_point_info[vfd_point] = (
-                        self.database_manager.get_vfd_point_info(vfd_point)
                     )
 
-                    if vfd_point_info[vfd_point]["active"] == 0:
-                        continue  # VFD point is not active
+                # Points to plot per preset, up to the first inactive point
+                preset_selection = {}
+                for preset in graph_presets:
+                    preset_selection[preset] = list(
+                        takewhile(point_info.__contains__, GRAPH_PRESETS[preset])
+                    )
 
-                    else:
-                        # Retrieve data from corresponding table
-                        timestamp_value_list_vfd = (
-                            self.database_manager.get_vfd_point_value(
-                                vfd_point_info[vfd_point]["vfd_id"],
-                                VFD_POINTS[vfd_point]["type"],
+                selected_io_vfd = [
+                    point for point in io_points + vfd_points if point in point_info
+                ]
+                selected_points = selected_io_vfd + [
+                    point for points in preset_selection.values() for point in points
+                ]
+
+                # Retrieve values for every active point, one query per table
+                io_ids_by_type = {}
+                vfd_keys = []
+                for point in dict.fromkeys(selected_points):
+                    if point in VFD_POINTS:
+                        vfd_keys.append(
+                            (
+                                int(point_info[point]["vfd_id"]),
+                                VFD_POINTS[point]["type"],
                             )
                         )
-
-                        # Add to data dictionary
-                        selected_data_manager.add_point(
-                            vfd_point, timestamp_value_list_vfd
+                    else:
+                        io_ids_by_type.setdefault(
+                            point_info[point]["io_type"], []
+                        ).append(int(point_info[point]["io_id"]))
+
+            # Tables are independent, so query them in parallel, each on its own
+            # pooled connection outside the transaction above
+            with ThreadPoolExecutor(max_workers=READ_POOL_SIZE) as executor:
+                futures = [
+                    executor.submit(
+                        self.database_manager.get_io_point_values_bulk,
+                        {io_type: io_ids},
+                    )
+                    for io_type, io_ids in io_ids_by_type.items()
+                ]
+                if vfd_keys:
+                    futures.append(
+                        executor.submit(
+                            self.database_manager.get_vfd_point_values_bulk,
+                            vfd_keys,
                         )
+                    )
 
-            except Exception as e:
-                pass
+                values = {}
+                for future in futures:
+                    values.update(future.result())
 
-        if graph_presets:
-            try:
+            # Timestamps are offset in place later, so repeat uses get copies
+            handed_out = set()
+
+            def timestamp_value_series(point: str) -> Dict:
+                if point in VFD_POINTS:
+                    key = (
+                        int(point_info[point]["vfd_id"]),
+                        VFD_POINTS[point]["type"],
+                    )
+                else:
+                    key = (
+                        point_info[point]["io_type"],
+                        int(point_info[point]["io_id"]),
+                    )
+                if key in handed_out:
+                    # The offset replaces the timestamp array, never edits it
+                    return dict(values[key])
+                handed_out.add(key)
+                return values[key]
+
+            # Add to data dictionary
+            for point in selected_io_vfd:
+                selected_data_manager.add_point(point, timestamp_value_series(point))
+
+            for preset, points in preset_selection.items():
+                for point in points:
+                    selected_data_manager.add_preset(
+                        preset, point, timestamp_value_series(point)
+                    )
 
-                graph_preset_point_info = {}
+        except sqlite3.Error as e:
+            # The bulk queries succeed or fail as a whole, so drop any
+            # partial selection rather than plotting part of it
+            logger.warning("Failed to read selected points: %s", e)
+            if STRICT_MODE:
+                raise
+            return SelectedDataManager().get_data()
+
+        # get_data() hands back the live dictionary, so the offset is applied in place
+        data = selected_data_manager.get_data()
+        offset = self._resolve_timezone_offset(allow_prompt=True)
+        if offset is not None:
+            return enter_time_zone_offset(data, offset)
+        else:
+            return data
 
-                # Grab points behind preset
-                for preset in graph_presets:
-                    preset_points = GRAPH_PRESETS[preset]
+    def _resolve_timezone_offset(self, allow_prompt: bool) -> Optional[int]:
+        """
+        Get the timezone offset, querying the database at most once per file.
 
-                    # Iterate through each point
-                    for point in preset_points:
+        Parameters:
+            allow_prompt (bool): Ask the user if the database has no offset
 
-                        # Determine if IO or VFD
-                        if point in VFD_POINTS.keys():  # VFD
+        Returns:
+            Optional[int]: Offset, or None if unknown
+        """
+        with self._tz_lock:
+            if self.time_zone_offset is not None:
+                return self.time_zone_offset
 
-                            # Retrieve info from VFDConfig@0
-                            graph_preset_point_info[point] = (
-                                self.database_manager.get_vfd_point_info(point)
-                            )
+            if not self._tz_checked:
+                self._tz_checked = True
+                self.time_zone_offset = self.database_manager.get_time_zone_offset()
+                if self.time_zone_offset is not None:
+                    return self.time_zone_offset
 
-                            if graph_preset_point_info[point]["active"] == 0:
-                                pass
-                                break  # VFD point is not active - skip preset
-
-                            else:
-                                # Retrieve data from corresonding table
-                                timestamp_value_list_preset = (
-                                    self.database_manager.get_vfd_point_value(
-                                        graph_preset_point_info[point]["vfd_id"],
-                                        VFD_POINTS[point]["type"],
-                                    )
-                                )
-
-                                # Add to data dictionary
-                                selected_data_manager.add_preset(
-                                    preset, point, timestamp_value_list_preset
-                                )
-
-                        else:  # IO
-
-                            # Retrieve info from IOConfig@0
-                            graph_preset_point_info[point] = (
-                                self.database_manager.get_io_point_info(point)
-                            )
+            if allow_prompt:
+                self.time_zone_offset = self._ask_for_timezone_offset()
 
-                            if graph_preset_point_info[point]["active"] == 0:
-                                pass
-                                break  # IO point is not active - skip preset
-
-                            else:
-                                # Retrieve data from corresponding table
-                                timestamp_value_list_preset = (
-                                    self.database_manager.get_io_point_value(
-                                        graph_preset_point_info[point]["io_id"],
-                                        graph_preset_point_info[point]["io_type"],
-                                    )
-                                )
-
-                                # Add to data dictionary
-                                selected_data_manager.add_preset(
-                                    preset, point, timestamp_value_list_preset
-                                )
-            except Exception as e:
-                pass
-
-        if self.time_zone_offset:
-            return enter_time_zone_offset(
-                selected_data_manager.get_data(), self.time_zone_offset
-            )
-        else:
-            self.time_zone_offset = self.database_manager.get_time_zone_offset()
-            if self.time_zone_offset:
-                return enter_time_zone_offset(
-                    selected_data_manager.get_data(), self.time_zone_offset
-                )
-            else:
-                offset_hours = self._ask_for_timezone_offset()
-                self.time_zone_offset = offset_hours
-                if offset_hours is not None:
-                    return enter_time_zone_offset(
-                        selected_data_manager.get_data(), offset_hours
-                    )
-                else:
-                    return selected_data_manager.get_data()
+            return self.time_zone_offset
 
     def _ask_for_timezone_offset(self) -> Optional[int]:
         """
@@ -275,13 +300,16 @@ class WorkflowManager:
         csv_generator = CSVGenerator()
         csv_generator.create_csv()
 
-        for category in data:
-            if category == "preset":
-                for preset_name, preset_data in data[category].items():
-                    csv_generator.add_preset_rows(preset_name, preset_data)
-            else:
-                for point_name, time_value_list in data[category].items():
-                    csv_generator.add_point_rows(point_name, time_value_list)
+        try:
+            for category in data:
+                if category == "preset":
+                    for preset_name, preset_data in data[category].items():
+                        csv_generator.add_preset_rows(preset_name, preset_data)
+                else:
+                    for point_name, time_value_list in data[category].items():
+                        csv_generator.add_point_rows(point_name, time_value_list)
+        finally:
+            csv_generator.close()
 
         return True
 
@@ -299,8 +327,11 @@ class WorkflowManager:
         graph_generator.generate_plots()
 
     def set_timezone_offset_ready(self):
-        """Set timezone offset signal waiting thread to ready."""
-        self.timezone_ready.set()
+        """Hand the current timezone offset to any waiting thread."""
+        try:
+            self._tz_future.set_result(self.time_zone_offset)
+        except InvalidStateError:
+            pass  # Already handed out for this file
 
     def process_incidents(self) -> List[Dict]:
         """
@@ -318,40 +349,25 @@ class WorkflowManager:
 
         incident_manager.load_text_dic()
 
-        # Load raw incidents into IncidentManager
-        raw_incidents = self.database_manager.get_all_incidents()
-
-        for incident in raw_incidents:
+        # Stream raw incidents into IncidentManager straight from the cursor
+        for incident in self.database_manager.iter_incidents():
             incident_manager.add_db_entry(incident)
 
         # Clean raw incidents
         incident_manager.clean_data()
 
-        if self.time_zone_offset:
-            self.set_timezone_offset_ready()
+        offset = self._resolve_timezone_offset(allow_prompt=True)
+        self.set_timezone_offset_ready()
+        if offset is not None:
             return apply_time_zone_offset_to_incidents(
-                incident_manager.get_clean_incidents(), self.time_zone_offset
+                incident_manager.get_clean_incidents(), offset
             )
         else:
-            self.time_zone_offset = self.database_manager.get_time_zone_offset()
-            if self.time_zone_offset:
-                self.set_timezone_offset_ready()
-                return apply_time_zone_offset_to_incidents(
-                    incident_manager.get_clean_incidents(), self.time_zone_offset
-                )
-            else:
-                offset_hours = self._ask_for_timezone_offset()
-                self.time_zone_offset = offset_hours
-                if offset_hours is not None:
-                    self.set_timezone_offset_ready()
-                    return apply_time_zone_offset_to_incidents(
-                        incident_manager.get_clean_incidents(), offset_hours
-                    )
-                else:
-                    self.set_timezone_offset_ready()
-                    return incident_manager.get_clean_incidents()
+            return incident_manager.get_clean_incidents()
 
-    def wait_for_timezone_offset(self) -> bool:
+    def wait_for_timezone_offset(
+        self, timeout: Optional[float] = None
+    ) -> Optional[int]:
         """
         Wait for timezone offset to be set by another thread.
 
@@ -359,9 +375,9 @@ class WorkflowManager:
             timeout (float): Maximum time to wait in seconds.
 
         Returns:
-            bool: True if timezone was set, False if not
+            Optional[int]: Offset, or None if the user gave none
         """
-        return self.timezone_ready.wait()
+        return self._tz_future.result(timeout)
 
     def populate_report(self, params: Dict) -> None:
         """
@@ -383,21 +399,19 @@ class WorkflowManager:
         start_timestamp = convert_timestamp_to_readable(report_info["first_timestamp"])
         end_timestamp = convert_timestamp_to_readable(report_info["last_timestamp"])
 
-        if not self.time_zone_offset:
-            offset = self.database_manager.get_time_zone_offset()
-            if offset:
-                pass
-                self.time_zone_offset = offset
-            else:
-                pass
-                if self.wait_for_timezone_offset():
-                    pass
-                else:
-                    pass
+        offset = self._resolve_timezone_offset(allow_prompt=False)
+        if offset is None:
+            # Incident processing prompts the user and hands over the result;
+            # show the report without an offset if it never does
+            try:
+                offset = self.wait_for_timezone_offset(TIME_ZONE_WAIT_TIMEOUT)
+            except TimeoutError:
+                logger.warning("Timed out waiting for the timezone offset")
+                offset = None
 
-        if self.time_zone_offset:
+        if offset is not None:
             new_timestamps = apply_time_zone_offset_to_report(
-                [start_timestamp, end_timestamp], self.time_zone_offset
+                [start_timestamp, end_timestamp], offset
             )
             start_timestamp, end_timestamp = new_timestamps
 
@@ -413,9 +427,13 @@ class WorkflowManager:
         self.time_zone_offset = offset
 
         if offset is None:
-            self.timezone_ready.clear()
-        else:
-            self.timezone_ready.set()
+            self._tz_checked = False
+
+        # Start a new handshake, unless threads are still waiting on this one
+        if self._tz_future.done():
+            self._tz_future = Future()
+        if offset is not None:
+            self.set_timezone_offset_ready()
 
     def close_database_connections(self) -> None:
         """Close all database connections."""
@@ -423,15 +441,10 @@ class WorkflowManager:
             if hasattr(self, "database_manager") and self.database_manager:
                 self.database_manager.close()
 
-            if hasattr(self, "conn") and self.conn:
-                self.conn.close()
-                self.conn = None
-
-            pass
-
         except Exception as e:
             pass
 
     def clear_cached_data(self) -> None:
         """Clear any cached database data."""
         self.merged_file = None
+        self.database_manager.clear_cache()
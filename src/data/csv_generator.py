@@ -2,17 +2,36 @@
 
 import csv
 import os
-from typing import List, Dict, Any, Optional
+from typing import Any, Dict, Optional
 from datetime import datetime
 
-from config.constants import DATA_FOLDER_PATH, CSV_TITLE, CSV_HEADERS
+import numpy as np
+
+from config.constants import (
+    CSV_TITLE,
+    CSV_HEADERS,
+    CSV_FLOAT_FORMAT,
+    get_data_folder_path,
+)
+
+# Write buffer for the open CSV file
+CSV_BUFFER_SIZE = 1024 * 1024
+
+# Rows joined into one string before each write
+CSV_ROWS_PER_WRITE = 8192
+
+# Characters that force a field to be quoted, matching csv.QUOTE_MINIMAL
+_QUOTE_TRIGGERS = (",", '"', "\r", "\n")
 
 
 class CSVGenerator:
     """Manages CSV file creation and operations."""
 
-    def __init__(self):
+    def __init__(self, float_format: Optional[str] = CSV_FLOAT_FORMAT):
         self.csv_file_path = None
+        self.float_format = float_format
+        self._file = None
+        self._writer = None
 
     def create_csv(self) -> bool:
         """
@@ -22,44 +41,38 @@ class CSVGenerator:
           bool: True if generation successful, False otherwise
         """
         try:
-            self.csv_file_path = os.path.join(DATA_FOLDER_PATH, CSV_TITLE)
-
-            with open(self.csv_file_path, "w", newline="", encoding="utf-8") as file:
-                writer = csv.DictWriter(file, fieldnames=CSV_HEADERS)
-                writer.writeheader()
+            self.csv_file_path = os.path.join(get_data_folder_path(), CSV_TITLE)
+
+            # Kept open for every append until close()
+            self._file = open(
+                self.csv_file_path,
+                "w",
+                newline="",
+                encoding="utf-8",
+                buffering=CSV_BUFFER_SIZE,
+            )
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(CSV_HEADERS)
 
             return True
         except Exception as e:
             pass
             return False
 
-    def add_point_rows(self, point_name: str, row_data: List[Dict[str, Any]]) -> bool:
+    def add_point_rows(self, point_name: str, row_data: Dict[str, np.ndarray]) -> bool:
         """
         Add a single point row to the CSV file following the format: Preset Name, Point Name, Timestamp, Value
 
         Parameters:
             point_name (str): Name of the point
-            row_data (List[Dict[str, Any]]): List of dictionaries containing timestamp and value
+            row_data (Dict[str, np.ndarray]): Timestamp and value arrays
 
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            rows_to_append = []
-
             # For each timestamp-value pair for this point
-            for entry in row_data:
-                row = {
-                    "Preset Name": "",
-                    "Point Name": point_name,
-                    "Timestamp": entry["timestamp"],
-                    "Value": entry["value"],
-                }
-                rows_to_append.append(row)
-
-            with open(self.csv_file_path, "a", newline="", encoding="utf-8") as file:
-                writer = csv.DictWriter(file, fieldnames=CSV_HEADERS)
-                writer.writerows(rows_to_append)
+            self._write_rows(_row_prefix("", point_name), row_data)
 
             return True
 
@@ -68,7 +81,7 @@ class CSVGenerator:
             return False
 
     def add_preset_rows(
-        self, preset_name: str, rows_data: Dict[str, List[Dict[str, Any]]]
+        self, preset_name: str, rows_data: Dict[str, Dict[str, np.ndarray]]
     ) -> bool:
         """
         Add preset rows to the CSV file following the format: Preset Name, Point Name, Timestamp, Value.
@@ -82,26 +95,82 @@ class CSVGenerator:
         """
 
         try:
-            rows_to_append = []
-
             # For each point in the preset
-            for point_name, time_value_list in rows_data.items():
-                # For each timestamp-value pair for this point
-                for entry in time_value_list:
-                    row = {
-                        "Preset Name": preset_name,
-                        "Point Name": point_name,
-                        "Timestamp": entry["timestamp"],
-                        "Value": entry["value"],
-                    }
-                    rows_to_append.append(row)
-
-            with open(self.csv_file_path, "a", newline="", encoding="utf-8") as file:
-                writer = csv.DictWriter(file, fieldnames=CSV_HEADERS)
-                writer.writerows(rows_to_append)
+            for point_name, series in rows_data.items():
+                self._write_rows(_row_prefix(preset_name, point_name), series)
 
             return True
 
         except Exception as e:
             pass
             return False
+
+    def _write_rows(self, prefix: str, row_data: Dict[str, np.ndarray]) -> None:
+        """
+        Write timestamp-value rows after an already encoded name prefix.
+
+        Parameters:
+            prefix (str): Encoded preset and point name columns with trailing comma
+            row_data (Dict[str, np.ndarray]): Timestamp and value arrays
+        """
+        buffer = []
+        append = buffer.append
+        float_format = self.float_format
+
+        # tolist() yields Python scalars, which format like the stored values
+        for timestamp, value in zip(
+            row_data["timestamp"].tolist(), row_data["value"].tolist()
+        ):
+            # Numbers never need quoting; anything else goes through _csv_field
+            if type(timestamp) in (int, float) and type(value) in (int, float):
+                if float_format and type(value) is float:
+                    value = float_format % value
+                append(f"{prefix}{timestamp},{value}\r\n")
+            else:
+                append(f"{prefix}{_csv_field(timestamp)},{_csv_field(value)}\r\n")
+
+            if len(buffer) >= CSV_ROWS_PER_WRITE:
+                self._file.write("".join(buffer))
+                buffer.clear()
+
+        self._file.write("".join(buffer))
+
+    def close(self) -> None:
+        """Flush and close the CSV file."""
+        if self._file:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+
+def _csv_field(field: Any) -> str:
+    """
+    Encode one field the way csv.writer does with the default dialect.
+
+    Parameters:
+        field (Any): Field value
+
+    Returns:
+        str: Encoded field
+    """
+    if field is None:
+        return ""
+
+    text = str(field)
+    if any(trigger in text for trigger in _QUOTE_TRIGGERS):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _row_prefix(preset_name: str, point_name: str) -> str:
+    """
+    Encode the name columns shared by every row of a point.
+
+    Parameters:
+        preset_name (str): Name of the preset, or "" for single points
+        point_name (str): Name of the point
+
+    Returns:
+        str: Encoded preset and point name columns with trailing comma
+    """
+    return f"{_csv_field(preset_name)},{_csv_field(point_name)},"
@@ -3,12 +3,165 @@
 import json
 import sqlite3
 import os
-from typing import List, Dict, Any, Optional, Tuple
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
 
-from config.constants import DATA_FOLDER_PATH, TIME_ZONE_OFFSET_ID
+import numpy as np
+
+from config.constants import TIME_ZONE_OFFSET_ID, get_data_folder_path
 from config.point_mapping import IO_TYPES, VFD_POINTS
 
+# Largest IN (...) list per query, kept under SQLite's bound-variable limit
+MAX_IN_PARAMETERS = 500
+
+# Read-only connections kept open for parallel point queries
+READ_POOL_SIZE = 4
+
+# Prepared statements sqlite3 keeps per connection, keyed by SQL text
+STATEMENT_CACHE_SIZE = 256
+
+# Applied to every connection: in-memory temp tables, 1 GiB of memory-mapped
+# I/O and a 128 MiB page cache for repeated point lookups. The mapping is shared
+# through the OS page cache, but each pooled connection has its own page cache
+CONNECTION_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=1073741824",
+    "PRAGMA cache_size=-131072",
+)
+
+# Applied on top for read-only connections
+READ_ONLY_PRAGMAS = ("PRAGMA query_only=ON",)
+
+# (index, table, columns) matching the filters of the point, incident and
+# offset queries, with the timestamp last so matches come back in time order
+QUERY_INDEXES = tuple(
+    (
+        f"idx_io_{io_type.lower()}_id_ts",
+        table,
+        "json_extract(rti_json_sample, '$.ioId'), SampleInfo_source_timestamp",
+    )
+    for io_type, table in IO_TYPES.items()
+) + (
+    (
+        "idx_vfd_id_ts",
+        "VFDInfo@0",
+        "json_extract(rti_json_sample, '$.vfdId'), SampleInfo_source_timestamp",
+    ),
+    ("idx_incident_ts", "IncidentAll@0", "SampleInfo_source_timestamp"),
+    (
+        "idx_parvalue_tidx_ts",
+        "ParValue@0",
+        "json_extract(rti_json_sample, '$.parNameTidx'), SampleInfo_source_timestamp",
+    ),
+)
+
+
+def open_connection(
+    database_path: str, read_only: bool = False, check_same_thread: bool = True
+) -> sqlite3.Connection:
+    """
+    Open a tuned database connection with rows accessible by column name.
+
+    Parameters:
+        database_path (str): Path to database file
+        read_only (bool): Open the file read-only
+        check_same_thread (bool): Restrict the connection to the opening thread
+
+    Returns:
+        sqlite3.Connection: Database connection
+    """
+    if read_only:
+        uri = Path(database_path).resolve().as_uri() + "?mode=ro"
+        connection = sqlite3.connect(
+            uri,
+            uri=True,
+            check_same_thread=check_same_thread,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+    else:
+        connection = sqlite3.connect(
+            database_path,
+            check_same_thread=check_same_thread,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+
+    connection.row_factory = sqlite3.Row  # Enable column access by name
+    for pragma in CONNECTION_PRAGMAS:
+        connection.execute(pragma)
+    if read_only:
+        for pragma in READ_ONLY_PRAGMAS:
+            connection.execute(pragma)
+    return connection
+
+
+class ReadConnectionPool:
+    """Reusable read-only connections that can be shared across threads."""
+
+    def __init__(self, database_path: str, size: int = READ_POOL_SIZE):
+        """
+        Initialize ReadConnectionPool.
+
+        Parameters:
+            database_path (str): Path to database file
+            size (int): Largest number of connections to open
+        """
+        self.database_path = database_path
+        self.size = size
+        self._idle = queue.Queue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a read-only connection."""
+        return open_connection(
+            self.database_path, read_only=True, check_same_thread=False
+        )
+
+    @contextmanager
+    def acquire(self):
+        """
+        Borrow a connection, opening one if the pool isn't full yet.
+
+        Yields:
+            sqlite3.Connection: Database connection
+        """
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._opened < self.size
+                if can_open:
+                    self._opened += 1
+            if can_open:
+                try:
+                    connection = self._open()
+                except Exception:
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+            else:
+                connection = self._idle.get()
+
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._opened -= 1
+
 
 class DatabaseManager:
     """Handles database connections and operations."""
@@ -19,36 +172,94 @@ class DatabaseManager:
 
         Parameters:
             database_path (str, optional): Path to database file.
-                                         Defaults to merged_db.sqlite in DATA_FOLDER_PATH
+                                         Defaults to merged_db.sqlite in the data folder
         """
         if database_path is None:
-            self.database_path = os.path.join(DATA_FOLDER_PATH, "merged_db.sqlite")
+            self.database_path = os.path.join(
+                get_data_folder_path(), "merged_db.sqlite"
+            )
         else:
             self.database_path = database_path
 
-        self._connection = None
+        self._local = threading.local()  # Per-thread read transaction connection
+        self._read_pool = None
+        self._read_pool_lock = threading.Lock()
+
+        # Config rows don't change once the merged file is built
+        self._io_info_cache = {}
+        self._vfd_info_cache = {}
+        self._time_zone_offset = _NOT_LOADED
+
+        # Table names checked before they're quoted into SQL; loaded on first use
+        self._known_tables: Optional[frozenset] = None
+
+    @contextmanager
+    def read_transaction(self):
+        """
+        Context manager that runs every query in this thread on one connection
+        inside a single read transaction. Nested uses join the outer transaction.
+
+        Yields:
+            sqlite3.Connection: Database connection
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            yield connection
+            return
+
+        with self._get_read_pool().acquire() as connection:
+            self._local.connection = connection
+            try:
+                connection.execute("BEGIN")
+                yield connection
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                self._local.connection = None
+
+    @contextmanager
+    def read_connection(self):
+        """
+        Context manager for a read-only connection that is safe to use from
+        worker threads. Uses this thread's read transaction when one is open.
+
+        Yields:
+            sqlite3.Connection: Database connection
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            yield connection
+            return
+
+        with self._get_read_pool().acquire() as connection:
+            yield connection
+
+    def _get_read_pool(self) -> ReadConnectionPool:
+        """
+        Get the connection pool, creating it on first use.
+
+        Returns:
+            ReadConnectionPool: Connections kept open until close()
+        """
+        with self._read_pool_lock:
+            if self._read_pool is None:
+                self._read_pool = ReadConnectionPool(self.database_path)
+            return self._read_pool
 
     @contextmanager
     def get_connection(self):
         """
         Context manager for database connections.
-        Ensures proper connection cleanup.
+        Borrows one of the manager's long-lived connections rather than
+        opening the file for every query; close() releases them.
 
         Yields:
             sqlite3.Connection: Database connection
         """
-        connection = None
-        try:
-            connection = sqlite3.connect(self.database_path)
-            connection.row_factory = sqlite3.Row  # Enable column access by name
+        with self.read_connection() as connection:
             yield connection
-        except sqlite3.Error as e:
-            if connection:
-                connection.rollback()
-            raise e
-        finally:
-            if connection:
-                connection.close()
 
     def get_io_point_info(self, name: str) -> dict:
         """
@@ -60,20 +271,11 @@ class DatabaseManager:
         Returns:
             dict: Dictionary containing io point info
         """
-        # Extract the JSON fields
-        query = """
-                SELECT 
-                    json_extract(rti_json_sample, '$.ioId') as io_id,
-                    json_extract(rti_json_sample, '$.ioType') as io_type,
-                    json_extract(rti_json_sample, '$.active') as active
-                FROM "IOConfig@0"
-                WHERE json_extract(rti_json_sample, '$.ioName') = ?
-                """
-
-        result = self.execute_custom_query(query, (name,))
-        return result[0] if result else {}
+        # Shares the config row cache with get_io_point_infos
+        info = self.get_io_point_infos([name]).get(name)
+        return dict(info) if info else {}
 
-    def get_io_point_value(self, io_id: str, io_type: str) -> List:
+    def get_io_point_value(self, io_id: str, io_type: str) -> Dict[str, np.ndarray]:
         """
         Retrieve io point values across time.
 
@@ -82,20 +284,80 @@ class DatabaseManager:
             io_type (str): io type of point
 
         Returns:
-            List: List of dictionaries containing the time and value
-        """
-        base_query = """
-                    SELECT 
-                        SampleInfo_source_timestamp as timestamp,
-                        json_extract(rti_json_sample, '$.value') as value
-                    FROM "{}"
-                    WHERE json_extract(rti_json_sample, '$.ioId') = ?
-                    """.format(
-            IO_TYPES[io_type]
-        )
+            Dict[str, np.ndarray]: Timestamp and value arrays
+        """
+        # IO_TYPES maps the type to its table, so only known tables are queried
+        query = _io_value_query(IO_TYPES[io_type])
+        with self.read_connection() as conn:
+            rows = _fetch_tuples(conn, query, (int(io_id),))
+        return _rows_to_series(rows)
+
+    def get_io_point_infos(
+        self, names: List[str], active_only: bool = False
+    ) -> Dict[str, dict]:
+        """
+        Retrieve ioid, iotype, and active from IOConfig for several points at once.
+
+        Parameters:
+            names (List[str]): ioNames to retrieve info for
+            active_only (bool): Omit points whose config marks them inactive
 
-        query = base_query + " ORDER BY SampleInfo_source_timestamp"
-        return self.execute_custom_query(query, (int(io_id),))
+        Returns:
+            Dict[str, dict]: io point info keyed by ioName, missing names are omitted
+        """
+        infos = self._io_info_cache
+        missing = [name for name in dict.fromkeys(names) if name not in infos]
+        for chunk in _chunks(missing):
+            query = """
+                    SELECT
+                        json_extract(rti_json_sample, '$.ioName') as io_name,
+                        json_extract(rti_json_sample, '$.ioId') as io_id,
+                        json_extract(rti_json_sample, '$.ioType') as io_type,
+                        json_extract(rti_json_sample, '$.active') as active
+                    FROM "IOConfig@0"
+                    WHERE json_extract(rti_json_sample, '$.ioName') IN ({})
+                    """.format(", ".join("?" * len(chunk)))
+            for row in self.execute_custom_query(query, tuple(chunk)):
+                # Keep the first match per name, as get_io_point_info does
+                infos.setdefault(
+                    row["io_name"],
+                    {
+                        "io_id": row["io_id"],
+                        "io_type": row["io_type"],
+                        "active": row["active"],
+                    },
+                )
+        return {
+            name: infos[name]
+            for name in names
+            if name in infos and not (active_only and infos[name]["active"] == 0)
+        }
+
+    def get_io_point_values_bulk(
+        self, ids_by_type: Dict[str, List[int]]
+    ) -> Dict[Tuple[str, int], Dict[str, np.ndarray]]:
+        """
+        Retrieve io point values across time for several points at once.
+
+        Parameters:
+            ids_by_type (Dict[str, List[int]]): io ids to retrieve, grouped by io type
+
+        Returns:
+            Dict[Tuple[str, int], Dict[str, np.ndarray]]: Timestamp and value arrays keyed by (io type, io id)
+        """
+        columns = {}
+        for io_type, io_ids in ids_by_type.items():
+            for chunk in _chunks([int(io_id) for io_id in dict.fromkeys(io_ids)]):
+                query = _io_values_query(IO_TYPES[io_type], len(chunk))
+                for io_id in chunk:
+                    columns[(io_type, io_id)] = ([], [])
+                with self.read_connection() as conn:
+                    rows = _fetch_tuples(conn, query, tuple(chunk))
+                for io_id, timestamp, value in rows:
+                    timestamps, values = columns[(io_type, io_id)]
+                    timestamps.append(timestamp)
+                    values.append(value)
+        return {key: _to_series(*lists) for key, lists in columns.items()}
 
     def get_vfd_point_info(self, name: str) -> dict:
         """
@@ -107,17 +369,11 @@ class DatabaseManager:
         Returns:
             dict: Dictionary containing vfd point info
         """
-        query = """
-                SELECT 
-                    json_extract(rti_json_sample, '$.vfdId') as vfd_id,
-                    json_extract(rti_json_sample, '$.active') as active
-                FROM "VFDConfig@0"
-                WHERE json_extract(rti_json_sample, '$.vfdName') = ?
-                """
-        result = self.execute_custom_query(query, (VFD_POINTS[name]["name"],))
-        return result[0] if result else {}
+        # Shares the config row cache with get_vfd_point_infos
+        info = self.get_vfd_point_infos([name]).get(name)
+        return dict(info) if info else {}
 
-    def get_vfd_point_value(self, vfd_id: str, vfd_type: str) -> List:
+    def get_vfd_point_value(self, vfd_id: str, vfd_type: str) -> Dict[str, np.ndarray]:
         """
         Retrieve VFD point values across time.
 
@@ -126,60 +382,131 @@ class DatabaseManager:
             vfd_type (str): VFD type of vfd point
 
         Returns:
-            List: List of dictionaries containing the time and value
+            Dict[str, np.ndarray]: Timestamp and value arrays
+        """
+        query = _vfd_value_query(vfd_type)
+        with self.read_connection() as conn:
+            rows = _fetch_tuples(conn, query, (int(vfd_id),))
+        return _rows_to_series(rows)
+
+    def get_vfd_point_infos(
+        self, names: List[str], active_only: bool = False
+    ) -> Dict[str, dict]:
         """
-        base_query = """
+        Retrieve vfdID, and active from VFDConfig for several points at once.
+
+        Parameters:
+            names (List[str]): Readable names from vfd points mapping
+            active_only (bool): Omit points whose config marks them inactive
+
+        Returns:
+            Dict[str, dict]: vfd point info keyed by readable name, missing names are omitted
+        """
+        infos = self._vfd_info_cache
+
+        # Several readable names can share one vfdName
+        names_by_vfd_name = {}
+        for name in dict.fromkeys(names):
+            if name not in infos:
+                names_by_vfd_name.setdefault(VFD_POINTS[name]["name"], []).append(name)
+
+        for chunk in _chunks(list(names_by_vfd_name)):
+            query = """
                     SELECT
-                        SampleInfo_source_timestamp as timestamp,
-                        json_extract(rti_json_sample, '$.{}') as value
-                    FROM "VFDInfo@0"
-                    WHERE json_extract(rti_json_sample, '$.vfdId') = ?
-                    """.format(
-            vfd_type
-        )
-        query = base_query + " ORDER BY SampleInfo_source_timestamp"
-        return self.execute_custom_query(query, (int(vfd_id),))
+                        json_extract(rti_json_sample, '$.vfdName') as vfd_name,
+                        json_extract(rti_json_sample, '$.vfdId') as vfd_id,
+                        json_extract(rti_json_sample, '$.active') as active
+                    FROM "VFDConfig@0"
+                    WHERE json_extract(rti_json_sample, '$.vfdName') IN ({})
+                    """.format(", ".join("?" * len(chunk)))
+            for row in self.execute_custom_query(query, tuple(chunk)):
+                for name in names_by_vfd_name[row["vfd_name"]]:
+                    infos.setdefault(
+                        name, {"vfd_id": row["vfd_id"], "active": row["active"]}
+                    )
+        return {
+            name: infos[name]
+            for name in names
+            if name in infos and not (active_only and infos[name]["active"] == 0)
+        }
+
+    def get_vfd_point_values_bulk(
+        self, points: List[Tuple[int, str]]
+    ) -> Dict[Tuple[int, str], Dict[str, np.ndarray]]:
+        """
+        Retrieve VFD point values across time for several points at once.
+
+        Parameters:
+            points (List[Tuple[int, str]]): (VFD ID, VFD type) of each point
+
+        Returns:
+            Dict[Tuple[int, str], Dict[str, np.ndarray]]: Timestamp and value arrays keyed by (VFD ID, VFD type)
+        """
+        # Every VFD point lives in one table; select each requested field once
+        fields = tuple(dict.fromkeys(vfd_type for _, vfd_type in points))
+
+        wanted = {}
+        for vfd_id, vfd_type in points:
+            wanted.setdefault(int(vfd_id), set()).add(fields.index(vfd_type))
+
+        columns = {
+            (vfd_id, fields[index]): ([], [])
+            for vfd_id, indexes in wanted.items()
+            for index in indexes
+        }
+        for chunk in _chunks(list(wanted)):
+            query = _vfd_values_query(fields, len(chunk))
+            with self.read_connection() as conn:
+                rows = _fetch_tuples(conn, query, tuple(chunk))
+            for vfd_id, timestamp, *field_values in rows:
+                for index in wanted[vfd_id]:
+                    timestamps, values = columns[(vfd_id, fields[index])]
+                    timestamps.append(timestamp)
+                    values.append(field_values[index])
+        return {key: _to_series(*lists) for key, lists in columns.items()}
 
     def get_all_incidents(self) -> List:
         """
         Retrieve all incidents in the database.
 
         Returns:
-            List: List of dictionaries containing: (timestamp, tidx, type, state, and args)
+            List: Rows containing: (timestamp, tidx, type, state, and args)
         """
 
-        query = """
-                SELECT
-                    SampleInfo_source_timestamp as timestamp,
-                    json_extract(rti_json_sample, '$.incidentTidx') as tidx,
-                    json_extract(rti_json_sample, '$.helpTidx') as help_tidx,
-                    json_extract(rti_json_sample, '$.type') as type,
-                    json_extract(rti_json_sample, '$.state') as state,
-                    json_extract(rti_json_sample, '$.args') as args
-                FROM "IncidentAll@0"
-                ORDER BY SampleInfo_source_timestamp
-                """
+        return self.execute_custom_query(INCIDENTS_QUERY)
 
-        return self.execute_custom_query(query)
+    def iter_incidents(self) -> Iterator[sqlite3.Row]:
+        """
+        Stream all incidents in the database without loading them into a list.
 
-    def find_user_id(self, user_id: str) -> List:
+        Yields:
+            sqlite3.Row: Row containing: (timestamp, tidx, type, state, and args)
         """
-        Searches fbhmi database for matching user_id and returns login name.
+        yield from self.iter_custom_query(INCIDENTS_QUERY)
+
+    def find_user_names(self, user_ids: List[str]) -> Dict[int, str]:
+        """
+        Look up login names for several user ids at once.
 
         Parameters:
-            user_id (str): User id to look up
+            user_ids (List[str]): User ids to look up
 
         Returns:
-            List: List containg data
+            Dict[int, str]: Login name keyed by user id, unknown ids are omitted
         """
-        query = """
-                SELECT
-                    userId as user_id,
-                    loginId as user_name
-                FROM "fb_users"
-                WHERE userId == ?
-                """
-        return self.execute_custom_query(query, user_id)
+        user_names = {}
+        for chunk in _chunks(list(dict.fromkeys(user_ids))):
+            query = """
+                    SELECT
+                        userId as user_id,
+                        loginId as user_name
+                    FROM "fb_users"
+                    WHERE userId IN ({})
+                    """.format(", ".join("?" * len(chunk)))
+            for row in self.execute_custom_query(query, tuple(chunk)):
+                # Keep the first match per id
+                user_names.setdefault(int(row["user_id"]), row["user_name"])
+        return user_names
 
     def get_report_info(self) -> Dict:
         """
@@ -205,32 +532,49 @@ class DatabaseManager:
         Returns:
             Optional[Dict]: Dictionary containing offset, or None if not found.
         """
-        query_to_find_tidx = """
-                            SELECT
-                                json_extract(rti_json_sample, '$.parNameTidx') as tidx
-                            FROM "ParConfig@0"
-                            WHERE json_extract(rti_json_sample, '$.parName') == "TimeZoneOffset"
-                            ORDER BY SampleInfo_source_timestamp
-                            LIMIT 1
-                            """
-        tidx = self.execute_custom_query(query_to_find_tidx)
-        tidx = tidx[0]["tidx"]
-
-        query_to_find_offset = """
-                                SELECT
-                                    json_extract(rti_json_sample, '$.value') as value
-                                from "ParValue@0"
-                                WHERE json_extract(rti_json_sample, '$.parNameTidx') == ?
-                                ORDER BY SampleInfo_source_timestamp
-                                LIMIT 1
-                                """
-
-        offset = self.execute_custom_query(query_to_find_offset, (tidx,))
+        if self._time_zone_offset is not _NOT_LOADED:
+            return self._time_zone_offset
+
+        # One statement finds the parameter's tidx and its first value
+        offset = self.execute_custom_query(TIME_ZONE_OFFSET_QUERY)
         if offset:
             offset = offset[0]
-            return json.loads(offset["value"])["longValue"]
+            self._time_zone_offset = json.loads(offset["value"])["longValue"]
         else:
-            return None
+            self._time_zone_offset = None
+        return self._time_zone_offset
+
+    def ensure_indexes(self) -> None:
+        """
+        Create the indexes behind the point, incident and offset queries.
+        Built once per merged file; tables missing from it are skipped.
+
+        Raises:
+            sqlite3.Error: If database operation fails
+        """
+        # Pooled connections are read-only, so the indexes need their own
+        connection = open_connection(self.database_path)
+        try:
+            existing = {
+                row[0]
+                for row in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table'"
+                )
+            }
+            for index, table, columns in QUERY_INDEXES:
+                if table in existing:
+                    connection.execute(
+                        f'CREATE INDEX IF NOT EXISTS {index} ON "{table}"({columns})'
+                    )
+            connection.commit()
+        finally:
+            connection.close()
+
+        # Idle pooled connections would plan against the schema they loaded
+        # before the indexes existed; reopen them on next use
+        with self._read_pool_lock:
+            if self._read_pool is not None:
+                self._read_pool.close()
 
     def database_exists(self) -> bool:
         """
@@ -273,7 +617,7 @@ class DatabaseManager:
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(f"PRAGMA table_info({table_name})")
+            cursor.execute(f"PRAGMA table_info({self._table_identifier(table_name)})")
             schema_info = cursor.fetchall()
             return [(row[1], row[2]) for row in schema_info]
 
@@ -287,9 +631,18 @@ class DatabaseManager:
         Returns:
             bool: True if table exists, False otherwise
         """
+        # Reuse the table list once _table_identifier has loaded it
+        if self._known_tables is not None:
+            return table_name in self._known_tables
+
         try:
-            table_names = self.get_table_names()
-            return table_name in table_names
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type='table' AND name=? LIMIT 1",
+                    (table_name,),
+                )
+                return cursor.fetchone() is not None
         except sqlite3.Error:
             return False
 
@@ -306,11 +659,31 @@ class DatabaseManager:
         Raises:
             sqlite3.Error: If table doesn't exist or database operation fails
         """
+        query = _row_count_query(self._table_identifier(table_name))
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            cursor.execute(query)
             return cursor.fetchone()[0]
 
+    def _table_identifier(self, table_name: str) -> str:
+        """
+        Quote a table name for SQL after checking the database has the table.
+
+        Parameters:
+            table_name (str): Name of the table
+
+        Returns:
+            str: Quoted identifier, the same string for every call
+
+        Raises:
+            sqlite3.Error: If table doesn't exist or database operation fails
+        """
+        if self._known_tables is None:
+            self._known_tables = frozenset(self.get_table_names())
+        if table_name not in self._known_tables:
+            raise sqlite3.OperationalError(f"no such table: {table_name}")
+        return _quote_identifier(table_name)
+
     def query_table(
         self,
         table_name: str,
@@ -342,7 +715,7 @@ class DatabaseManager:
             select_clause = ", ".join(columns)
 
         # Build query
-        query = f"SELECT {select_clause} FROM {table_name}"
+        query = f"SELECT {select_clause} FROM {self._table_identifier(table_name)}"
 
         if where_clause:
             query += f" WHERE {where_clause}"
@@ -363,7 +736,7 @@ class DatabaseManager:
 
     def execute_custom_query(
         self, query: str, parameters: Optional[Tuple] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[sqlite3.Row]:
         """
         Execute a custom SQL query.
 
@@ -372,7 +745,7 @@ class DatabaseManager:
             parameters (Tuple, optional): Parameters for parameterized queries
 
         Returns:
-            List[Dict[str, Any]]: Query results as list of dictionaries
+            List[sqlite3.Row]: Query results, readable by column name or index
 
         Raises:
             sqlite3.Error: If database operation fails
@@ -384,8 +757,34 @@ class DatabaseManager:
             else:
                 cursor.execute(query)
 
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            # Rows already read by name, so no dict is built per row
+            return cursor.fetchall()
+
+    def iter_custom_query(
+        self, query: str, parameters: Optional[Tuple] = None
+    ) -> Iterator[sqlite3.Row]:
+        """
+        Execute a custom SQL query and stream its rows instead of loading them all.
+        The connection stays borrowed until the iterator is exhausted or closed.
+
+        Parameters:
+            query (str): SQL query to execute
+            parameters (Tuple, optional): Parameters for parameterized queries
+
+        Yields:
+            sqlite3.Row: Query result, readable by column name or index
+
+        Raises:
+            sqlite3.Error: If database operation fails
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            if parameters:
+                cursor.execute(query, parameters)
+            else:
+                cursor.execute(query)
+
+            yield from cursor
 
     def get_data_by_time_range(
         self,
@@ -416,7 +815,7 @@ class DatabaseManager:
         else:
             select_clause = ", ".join(columns)
 
-        query = f"SELECT {select_clause} FROM {table_name} WHERE {where_clause} ORDER BY {time_column}"
+        query = f"SELECT {select_clause} FROM {self._table_identifier(table_name)} WHERE {where_clause} ORDER BY {time_column}"
 
         with self.get_connection() as conn:
             cursor = conn.cursor()
@@ -488,24 +887,282 @@ class DatabaseManager:
             # Get database file size
             info["database_size"] = os.path.getsize(self.database_path)
 
-            # Get table information
+            # Get table information; each worker borrows its own pooled connection
             table_names = self.get_table_names()
-            for table_name in table_names:
-                try:
-                    row_count = self.get_table_row_count(table_name)
-                    schema = self.get_table_schema(table_name)
-                    info["tables"][table_name] = {
-                        "row_count": row_count,
-                        "columns": len(schema),
-                        "schema": schema,
-                    }
-                except sqlite3.Error as e:
-                    info["tables"][table_name] = {"error": str(e)}
+            if table_names:
+                with ThreadPoolExecutor(
+                    max_workers=min(READ_POOL_SIZE, len(table_names))
+                ) as executor:
+                    info["tables"] = dict(
+                        zip(table_names, executor.map(self._table_info, table_names))
+                    )
 
         return info
 
+    def _table_info(self, table_name: str) -> Dict[str, Any]:
+        """
+        Get row count and schema for one table.
+
+        Parameters:
+            table_name (str): Name of the table
+
+        Returns:
+            Dict[str, Any]: Row count, column count and schema, or the error
+        """
+        try:
+            row_count = self.get_table_row_count(table_name)
+            schema = self.get_table_schema(table_name)
+            return {
+                "row_count": row_count,
+                "columns": len(schema),
+                "schema": schema,
+            }
+        except sqlite3.Error as e:
+            return {"error": str(e)}
+
+    def __enter__(self) -> "DatabaseManager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def close(self):
         """Clean up any persistent connections."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        with self._read_pool_lock:
+            if self._read_pool is not None:
+                self._read_pool.close()
+                self._read_pool = None
+
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Forget cached config rows, e.g. once the merged file is replaced."""
+        self._io_info_cache.clear()
+        self._vfd_info_cache.clear()
+        self._time_zone_offset = _NOT_LOADED
+        self._known_tables = None
+
+
+# Marks a cached lookup that hasn't run yet, since None is a valid result
+_NOT_LOADED = object()
+
+# First TimeZoneOffset value, found through the parameter's tidx in ParConfig@0
+TIME_ZONE_OFFSET_QUERY = """
+        SELECT
+            json_extract(rti_json_sample, '$.value') as value
+        FROM "ParValue@0"
+        WHERE json_extract(rti_json_sample, '$.parNameTidx') == (
+            SELECT
+                json_extract(rti_json_sample, '$.parNameTidx')
+            FROM "ParConfig@0"
+            WHERE json_extract(rti_json_sample, '$.parName') == 'TimeZoneOffset'
+            ORDER BY SampleInfo_source_timestamp
+            LIMIT 1
+        )
+        ORDER BY SampleInfo_source_timestamp
+        LIMIT 1
+        """
+
+# Every incident, oldest first
+INCIDENTS_QUERY = """
+        SELECT
+            SampleInfo_source_timestamp as timestamp,
+            json_extract(rti_json_sample, '$.incidentTidx') as tidx,
+            json_extract(rti_json_sample, '$.helpTidx') as help_tidx,
+            json_extract(rti_json_sample, '$.type') as type,
+            json_extract(rti_json_sample, '$.state') as state,
+            json_extract(rti_json_sample, '$.args') as args
+        FROM "IncidentAll@0"
+        ORDER BY SampleInfo_source_timestamp
+        """
+
+
+@lru_cache(maxsize=None)
+def _quote_identifier(name: str) -> str:
+    """
+    Quote an SQL identifier such as a table name.
+
+    Parameters:
+        name (str): Identifier to quote
+
+    Returns:
+        str: Identifier in double quotes, with embedded quotes doubled
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+# SQL text is built once per shape so pooled connections, which outlive a
+# single run, keep hitting sqlite3's per-connection prepared statement cache
+@lru_cache(maxsize=None)
+def _row_count_query(table: str) -> str:
+    """
+    Build the row count query for a table.
+
+    Parameters:
+        table (str): Quoted table name
+
+    Returns:
+        str: SQL query
+    """
+    return f"SELECT COUNT(*) FROM {table}"
+
+
+@lru_cache(maxsize=None)
+def _io_value_query(table: str) -> str:
+    """
+    Build the value query for a single io point.
+
+    Parameters:
+        table (str): Table holding the io type's samples
+
+    Returns:
+        str: SQL query
+    """
+    return """
+            SELECT
+                SampleInfo_source_timestamp as timestamp,
+                json_extract(rti_json_sample, '$.value') as value
+            FROM "{}"
+            WHERE json_extract(rti_json_sample, '$.ioId') = ?
+            ORDER BY SampleInfo_source_timestamp
+            """.format(table)
+
+
+@lru_cache(maxsize=None)
+def _vfd_value_query(field: str) -> str:
+    """
+    Build the value query for a single VFD point.
+
+    Parameters:
+        field (str): VFD type to extract
+
+    Returns:
+        str: SQL query
+    """
+    return """
+            SELECT
+                SampleInfo_source_timestamp as timestamp,
+                json_extract(rti_json_sample, '$.{}') as value
+            FROM "VFDInfo@0"
+            WHERE json_extract(rti_json_sample, '$.vfdId') = ?
+            ORDER BY SampleInfo_source_timestamp
+            """.format(field)
+
+
+@lru_cache(maxsize=None)
+def _io_values_query(table: str, id_count: int) -> str:
+    """
+    Build the io value query for one io type table. Rows are split per id
+    afterwards, so ordering by id first lets the id index skip the sort.
+
+    Parameters:
+        table (str): Table holding the io type's samples
+        id_count (int): Number of io ids bound to the IN (...) list
+
+    Returns:
+        str: SQL query
+    """
+    return """
+            SELECT
+                json_extract(rti_json_sample, '$.ioId') as io_id,
+                SampleInfo_source_timestamp as timestamp,
+                json_extract(rti_json_sample, '$.value') as value
+            FROM "{}"
+            WHERE json_extract(rti_json_sample, '$.ioId') IN ({})
+            ORDER BY io_id, SampleInfo_source_timestamp
+            """.format(table, ", ".join("?" * id_count))
+
+
+@lru_cache(maxsize=None)
+def _vfd_values_query(fields: Tuple[str, ...], id_count: int) -> str:
+    """
+    Build the VFD value query selecting several fields from VFDInfo.
+
+    Parameters:
+        fields (Tuple[str, ...]): VFD types to extract, in column order
+        id_count (int): Number of VFD ids bound to the IN (...) list
+
+    Returns:
+        str: SQL query
+    """
+    field_columns = ", ".join(
+        "json_extract(rti_json_sample, '$.{}') as field_{}".format(field, index)
+        for index, field in enumerate(fields)
+    )
+    return """
+            SELECT
+                json_extract(rti_json_sample, '$.vfdId') as vfd_id,
+                SampleInfo_source_timestamp as timestamp,
+                {}
+            FROM "VFDInfo@0"
+            WHERE json_extract(rti_json_sample, '$.vfdId') IN ({})
+            ORDER BY vfd_id, SampleInfo_source_timestamp
+            """.format(field_columns, ", ".join("?" * id_count))
+
+
+def _fetch_tuples(
+    connection: sqlite3.Connection, query: str, parameters: Tuple
+) -> List:
+    """
+    Run a query and return plain tuples, skipping the connection's row factory.
+
+    Parameters:
+        connection (sqlite3.Connection): Database connection
+        query (str): SQL query to execute
+        parameters (Tuple): Parameters for the query
+
+    Returns:
+        List: Result rows as tuples in column order
+    """
+    cursor = connection.cursor()
+    cursor.row_factory = None
+    return cursor.execute(query, parameters).fetchall()
+
+
+def _to_series(timestamps: List, values: List) -> Dict[str, np.ndarray]:
+    """
+    Pack one point's samples into parallel timestamp and value arrays.
+
+    Parameters:
+        timestamps (List): Sample timestamps (nanoseconds)
+        values (List): Sample values, in timestamp order
+
+    Returns:
+        Dict[str, np.ndarray]: "timestamp" and "value" arrays of equal length
+    """
+    # Values keep numpy's inferred dtype so ints, floats and NULLs read back as stored
+    return {
+        "timestamp": np.array(timestamps, dtype=np.int64),
+        "value": np.array(values),
+    }
+
+
+def _rows_to_series(rows: List[Tuple]) -> Dict[str, np.ndarray]:
+    """
+    Pack (timestamp, value) rows into parallel timestamp and value arrays.
+
+    Parameters:
+        rows (List[Tuple]): (timestamp, value) rows, in timestamp order
+
+    Returns:
+        Dict[str, np.ndarray]: "timestamp" and "value" arrays of equal length
+    """
+    if not rows:
+        return _to_series([], [])
+    timestamps, values = zip(*rows)
+    return _to_series(timestamps, values)
+
+
+def _chunks(items: List, size: int = MAX_IN_PARAMETERS):
+    """
+    Split a list into consecutive slices for IN (...) queries.
+
+    Parameters:
+        items (List): Values to split
+        size (int): Largest slice length
+
+    Yields:
+        List: Slice of at most size values
+    """
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
@@ -4,22 +4,47 @@ import xml.etree.ElementTree as ET
 import json
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Tuple, Dict, Optional
 import os
 import html
-from bs4 import BeautifulSoup
+from html.parser import HTMLParser
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # Optional; ElementTree streams the file too, just slower
+    lxml_etree = None
+
+try:
+    import orjson
+except ImportError:  # Optional; the json module parses the arguments too, just slower
+    orjson = None
 
 from config.incident_config import (
     INCIDENT_TYPE,
     INCIDENT_STATE,
-    INCIDENT_COLORS,
     INCIDENT_ARGUMENTS,
+    INCIDENT_COLOR_TABLE,
+    IncidentColor,
 )
 from util.file_util import get_xml_file
 from util.time_util import convert_timestamp_to_readable
-from config.constants import DATA_FOLDER_PATH
+from config.constants import get_data_folder_path
 from data.database_manager import DatabaseManager
 
+# Color for each incident type; anything else is treated as an alarm
+_TYPE_COLORS = {
+    INCIDENT_TYPE["event"]: IncidentColor.EVENT,
+    INCIDENT_TYPE["warning"]: IncidentColor.WARNING,
+}
+
+# Incident text patterns, compiled once
+_PCT_TOKEN = re.compile(r"%[^%]*")  # % up to the next % or the end of the word
+_PCT_TAIL = re.compile(r"%.*?([a-zA-Z])(\d+)")  # Format letter, argument position
+_PCT_D = re.compile(r"%(\d+)d")  # Zero-fill width of %Nd
+_PCT_F = re.compile(r"%\.(\d+)f")  # Precision of %.Nf
+_USER_RE = re.compile(r"User (\d+)")  # User id to replace with a login name
+
 
 class IncidentManager:
     """Manages all incidents in the database."""
@@ -28,13 +53,16 @@ class IncidentManager:
 
         self.db_entries = (
             []
-        )  # Raw database entries {"timestamp": "", "tidx": "", "type": "", "state": "", "args": []}
+        )  # Raw database entries {"timestamp": "", "tidx": "", "type": "", "state": "", "args": "[]"}
         self.xml_file_path = None
         self.text_dic: Dict[int, str] = {}
         self.true_incidents = (
             []
         )  # Clean incidents from database entries {"timestamp": "", "text": "", "label_color": "", "text_color": ""}
 
+        # fbhmi.db login names for the "User N" ids in the incident texts
+        self._user_names: Dict[int, str] = {}
+
     def set_xml_file(self) -> None:
         """Set text dic for the incident manager."""
         self.xml_file_path = get_xml_file() if get_xml_file() is not None else None
@@ -43,20 +71,27 @@ class IncidentManager:
         """Load text dictionary from XML file."""
 
         try:
-            tree = ET.parse(self.xml_file_path)
-            root = tree.getroot()
+            # Stream <item> elements instead of building the whole tree
+            if lxml_etree is not None:
+                items = lxml_etree.iterparse(self.xml_file_path, tag="item")
+            else:
+                items = (
+                    (event, element)
+                    for event, element in ET.iterparse(self.xml_file_path)
+                    if element.tag == "item"
+                )
 
-            for item in root.findall(".//item"):
-                index_elem = item.find("index")
-                text_elem = item.find("text")
+            for _, item in items:
+                index_text = item.findtext("index")
+                text_content = item.findtext("text")
 
-                if index_elem is not None and text_elem is not None:
+                if index_text is not None and text_content is not None:
                     try:
-                        index_num = int(index_elem.text)
-                        text_content = text_elem.text or ""
-                        self.text_dic[index_num] = text_content
+                        self.text_dic[int(index_text)] = text_content
                     except ValueError:
-                        continue
+                        pass
+
+                item.clear()
 
         except Exception as e:
             pass
@@ -82,24 +117,26 @@ class IncidentManager:
             str: String with inserted arguments
         """
 
-        words = base_text.split(" ")  # Splits on a single space
         new_words = []
         count = 0
+        arg_index = 0  # Next argument to insert; args itself is left untouched
 
-        for word in words:
-            if "%" in word:
-                pattern = r"%[^%]*"
-                # Pattern: % followed by any characters until the next %
-                ########## or to the end of the string
+        # Bound once rather than looked up for every specifier
+        long_key = INCIDENT_ARGUMENTS["d"]
+        string_key = INCIDENT_ARGUMENTS["s"]
+        real_key = INCIDENT_ARGUMENTS["f"]
+        get_text = self._get_text_by_index
 
-                parts = re.findall(pattern, word)
+        # Texts repeat across incidents, so the split is cached per text
+        for word, parts in _split_template(base_text):
+            if parts is not None:
                 temp_parts = []
 
                 for part in parts:
 
                     if "d" in part or "s" in part or "f" in part:
 
-                        match = re.search(r"%.*?([a-zA-Z])(\d+)", part)
+                        match = _PCT_TAIL.search(part)
                         # Pattern: % followed by any characters and then letter(s), then capture digits
                         if match:
                             numerical_part = int(match.group(2))
@@ -124,7 +161,7 @@ class IncidentManager:
                         if "d" in part:
 
                             digit_len = None
-                            match = re.search(r"%(\d+)d", part)
+                            match = _PCT_D.search(part)
                             # Pattern: % followed by captured digits, then d
                             if match:
 
@@ -135,30 +172,28 @@ class IncidentManager:
                                 digit_len = int(digit_len)
 
                                 # longValue argument from arguments list filled to match the correct length
-                                digit_to_insert = str(
-                                    args[0][INCIDENT_ARGUMENTS["d"]]
-                                ).zfill(digit_len)
+                                digit_to_insert = str(args[arg_index][long_key]).zfill(
+                                    digit_len
+                                )
                             else:
 
-                                digit_to_insert = str(args[0][INCIDENT_ARGUMENTS["d"]])
+                                digit_to_insert = str(args[arg_index][long_key])
 
                             part = part.replace("%d", digit_to_insert)
 
-                            args.pop(0)
+                            arg_index += 1
 
                         elif "s" in part:
 
                             # Find text to insert from text dic, then replace the %s with it
                             part = part.replace(
                                 "%s",
-                                self._get_text_by_index(
-                                    args[0][INCIDENT_ARGUMENTS["s"]]
-                                ),
+                                get_text(args[arg_index][string_key]),
                             )
-                            args.pop(0)
+                            arg_index += 1
                         else:
 
-                            match = re.search(r"%\.(\d+)f", part)
+                            match = _PCT_F.search(part)
                             # Pattern: Caputures digits between %. and f
                             if match:
 
@@ -166,15 +201,15 @@ class IncidentManager:
                                 # Replaces %.2f or similar with formatted number from argument
                                 part = part.replace(
                                     f"%.{precision}f",
-                                    f"{args[0][INCIDENT_ARGUMENTS["f"]]:.{precision}f}",
+                                    f"{args[arg_index][real_key]:.{precision}f}",
                                 )
-                                args.pop(0)
+                                arg_index += 1
                             else:
 
                                 part = part.replace(
-                                    "%f", str(args[0][INCIDENT_ARGUMENTS["f"]])
+                                    "%f", str(args[arg_index][real_key])
                                 )
-                                args.pop(0)
+                                arg_index += 1
 
                     else:
                         pass
@@ -188,7 +223,7 @@ class IncidentManager:
 
                 new_words.append(word)
 
-        final_text = self._check_for_user(" ".join(new_words))
+        final_text = " ".join(new_words)
 
         return final_text
 
@@ -203,25 +238,18 @@ class IncidentManager:
             str: Original text if no replacement needed, otherwise the original text with replacement.
         """
 
-        pattern = r"User \d+"
-        matches = re.findall(pattern, text)
+        user_ids = _USER_RE.findall(text)
 
-        if matches:
-            database_manager = DatabaseManager(
-                os.path.join(DATA_FOLDER_PATH, "fbhmi.db")
-            )
-            digit_pattern = r"\d+"
+        if user_ids:
 
-            for match in matches:
+            for user_id in user_ids:
 
-                digits = re.findall(digit_pattern, match)
-                query_results = database_manager.find_user_id(digits)
-                if query_results:
-                    user_name = query_results[0]["user_name"]
-                    text = text.replace(str(digits[0]), user_name)
+                user_name = self._user_names.get(int(user_id))
+                if user_name is not None:
+                    text = text.replace(user_id, user_name)
                 else:
                     pass
-                    # text = text.replace(str(digits[0]), "UNKNOWN")
+                    # text = text.replace(user_id, "UNKNOWN")
 
             return text
 
@@ -241,9 +269,11 @@ class IncidentManager:
 
         decoded_help_text = html.unescape(base_help_text)
 
-        soup = BeautifulSoup(decoded_help_text, "html.parser")
+        parser = _HelpTextParser()
+        parser.feed(decoded_help_text)
+        parser.close()
 
-        return soup.get_text(separator="/n")
+        return "/n".join(parser.strings)
 
     def add_db_entry(self, entry: dict) -> None:
         """Add an incident entry to the list."""
@@ -255,7 +285,8 @@ class IncidentManager:
                 "help_tidx": entry["help_tidx"],
                 "type": entry["type"],
                 "state": entry["state"],
-                "args": json.loads(entry["args"]),
+                # JSON text; clean_data parses it once per distinct argument list
+                "args": entry["args"],
             }
         )
 
@@ -274,41 +305,30 @@ class IncidentManager:
             Tuple: Color for the label, color for the text
         """
 
-        if entry["state"] == INCIDENT_STATE["clear"]:
-
-            if (
-                entry["type"] == INCIDENT_TYPE["event"]
-            ):  # Incident is an event: return grey/green
-                return INCIDENT_COLORS["clear"], INCIDENT_COLORS["event"]
-
-            elif (
-                entry["type"] == INCIDENT_TYPE["warning"]
-            ):  # Incident is a warning: return grey/orange
-                return INCIDENT_COLORS["clear"], INCIDENT_COLORS["warning"]
-
-            else:  # Incident is an alarm: return grey/red
-                return INCIDENT_COLORS["clear"], INCIDENT_COLORS["alarm"]
-
-        else:
-
-            if (
-                entry["type"] == INCIDENT_TYPE["event"]
-            ):  # Incident is an event: return green/black
-                return INCIDENT_COLORS["event"], INCIDENT_COLORS["black_text"]
+        type_color = INCIDENT_COLOR_TABLE[
+            _TYPE_COLORS.get(entry["type"], IncidentColor.ALARM)
+        ]
 
-            elif (
-                entry["type"] == INCIDENT_TYPE["warning"]
-            ):  # Incident is a warning: return orange/black
-                return INCIDENT_COLORS["warning"], INCIDENT_COLORS["black_text"]
+        # Cleared incidents: grey label, type-colored text
+        if entry["state"] == INCIDENT_STATE["clear"]:
+            return INCIDENT_COLOR_TABLE[IncidentColor.CLEAR], type_color
 
-            else:  # Incident is an alarm: return red/black
-                return INCIDENT_COLORS["alarm"], INCIDENT_COLORS["black_text"]
+        # Active incidents: type-colored label, black text
+        return type_color, INCIDENT_COLOR_TABLE[IncidentColor.BLACK_TEXT]
 
     def clean_data(self) -> None:
         """
         Clean up all raw database entries into readable incidents.
         """
 
+        # Many incidents share a help text, so each is parsed only once
+        help_texts = {}
+
+        # Recurring incidents (e.g. a cycling alarm) repeat the same text and
+        # arguments, so each combination is rendered only once
+        texts = {}
+
+        clean_incidents = []
         for entry in self.db_entries:
 
             clean_incident = {}
@@ -317,19 +337,56 @@ class IncidentManager:
                 entry["timestamp"]
             )
 
-            # Process text from text dic
-            base_text = self._get_text_by_index(entry["tidx"])
-            base_help_text = self._get_text_by_index(entry["help_tidx"])
+            help_tidx = entry["help_tidx"]
+            if help_tidx not in help_texts:
+                base_help_text = self._get_text_by_index(help_tidx)
+                help_texts[help_tidx] = self._parse_help_text(base_help_text)
 
-            clean_incident["help_text"] = self._parse_help_text(base_help_text)
+            clean_incident["help_text"] = help_texts[help_tidx]
 
-            clean_incident["text"] = self._insert_arguments(base_text, entry["args"])
+            # SQLite writes the same arguments as the same JSON text, so the
+            # text itself is the key and repeats are never parsed
+            text_key = (entry["tidx"], entry["args"])
+            if text_key not in texts:
+                # Process text from text dic
+                base_text = self._get_text_by_index(entry["tidx"])
+                texts[text_key] = self._insert_arguments(
+                    base_text, _loads_json(entry["args"])
+                )
+            clean_incident["text"] = texts[text_key]
 
             clean_incident["label_color"], clean_incident["text_color"] = (
                 self.get_incident_color(entry)
             )
 
-            self.true_incidents.append(clean_incident)
+            clean_incidents.append(clean_incident)
+
+        # Look up every user named in the texts with one query, then fill them in
+        self._load_user_names([incident["text"] for incident in clean_incidents])
+        user_texts = {}
+        for clean_incident in clean_incidents:
+            text = clean_incident["text"]
+            if text not in user_texts:
+                user_texts[text] = self._check_for_user(text)
+            clean_incident["text"] = user_texts[text]
+
+        self.true_incidents.extend(clean_incidents)
+
+    def _load_user_names(self, texts: List[str]) -> None:
+        """
+        Load login names for every "User N" id found in the texts.
+
+        Parameters:
+            texts (List[str]): Incident texts
+        """
+        user_ids = [user_id for text in texts for user_id in _USER_RE.findall(text)]
+        if not user_ids:
+            return
+
+        with DatabaseManager(
+            os.path.join(get_data_folder_path(), "fbhmi.db")
+        ) as database_manager:
+            self._user_names.update(database_manager.find_user_names(user_ids))
 
     def get_clean_incidents(self) -> List[Dict]:
         """
@@ -339,3 +396,81 @@ class IncidentManager:
             List: List of dictionaries containing readable timestamp, text, label_color, and text_color
         """
         return self.true_incidents
+
+
+class _HelpTextParser(HTMLParser):
+    """Collects the text nodes of help text markup, skipping tags and comments."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.strings: List[str] = []
+        self._in_text = False  # Data split at a stray "<" belongs to one node
+        self._skip_depth = 0  # Inside <script>/<style>, which carry no text
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        self._in_text = False
+        if tag in ("script", "style"):
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        self._in_text = False
+        if tag in ("script", "style") and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_comment(self, data: str) -> None:
+        self._in_text = False
+
+    def handle_decl(self, decl: str) -> None:
+        self._in_text = False
+
+    def handle_pi(self, data: str) -> None:
+        self._in_text = False
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        if self._in_text:
+            self.strings[-1] += data
+        else:
+            self.strings.append(data)
+            self._in_text = True
+
+
+def _loads_json(text: str):
+    """
+    Parse a JSON document, with orjson when it is installed.
+
+    Parameters:
+        text (str): JSON text
+
+    Returns:
+        Any: Parsed value
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN, which only the json module accepts
+    return json.loads(text)
+
+
+@lru_cache(maxsize=None)
+def _split_template(
+    base_text: str,
+) -> Tuple[Tuple[str, Optional[Tuple[str, ...]]], ...]:
+    """
+    Split incident text into words, with the % parts of each word that has any.
+
+    Parameters:
+        base_text (str): Base string
+
+    Returns:
+        Tuple: (word, % parts or None) for each space separated word
+    """
+    words = []
+    for word in base_text.split(" "):  # Splits on a single space
+        if "%" in word:
+            words.append((word, tuple(_PCT_TOKEN.findall(word))))
+        else:
+            words.append((word, None))
+    return tuple(words)
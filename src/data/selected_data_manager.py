@@ -3,8 +3,13 @@
 from datetime import datetime, timedelta
 
 from typing import List, Dict
+import numpy as np
+
 from config.point_mapping import VFD_POINTS
 
+# Names that are filed under "vfd"; everything else is an IO point
+_VFD_KEYS = frozenset(VFD_POINTS)
+
 
 class SelectedDataManager:
     """Manages dictionary operations for the user selected data."""
@@ -16,30 +21,26 @@ class SelectedDataManager:
         self.data["vfd"] = {}
         self.data["preset"] = {}
 
-    def add_point(self, name: str, time_value_list: List) -> bool:
+    def add_point(self, name: str, series: Dict[str, np.ndarray]) -> bool:
         """
         Add a point to the data dictionary
 
         Parameters:
           name (str): Name of the IO or VFD Point
-          time_value_list (List): List of timestamp and value entries for the point
+          series (Dict[str, np.ndarray]): Timestamp and value arrays for the point
 
         Returns:
           bool: True if adding successful, False otherwise
         """
 
-        try:
-            if name in VFD_POINTS.keys():
-                self.data["vfd"][name] = time_value_list
-            else:
-                self.data["io"][name] = time_value_list
-            return True
-        except Exception as e:
-            pass
-            return False
+        if name in _VFD_KEYS:
+            self.data["vfd"][name] = series
+        else:
+            self.data["io"][name] = series
+        return True
 
     def add_preset(
-        self, preset_name: str, point_name: str, time_value_list: List
+        self, preset_name: str, point_name: str, series: Dict[str, np.ndarray]
     ) -> bool:
         """
         Add an preset graph to the data dictionary
@@ -47,7 +48,7 @@ class SelectedDataManager:
         Parameters:
           preset_name (str): Name of the preset
           point_name (str): Name of the point to add
-          time_value_list (List): List of timestamp and value entries for the preset
+          series (Dict[str, np.ndarray]): Timestamp and value arrays for the point
 
         Returns:
           bool: True if adding successful, False otherwise
@@ -57,7 +58,7 @@ class SelectedDataManager:
             if preset_name not in self.data["preset"]:
                 self.data["preset"][preset_name] = {}
 
-            self.data["preset"][preset_name][point_name] = time_value_list
+            self.data["preset"][preset_name][point_name] = series
             return True
         except Exception as e:
             pass
@@ -9,6 +9,7 @@ Version: 2.0
 """
 
 import sys, os
+import logging
 from pathlib import Path
 
 # Add project root to Python path for imports
@@ -19,6 +20,8 @@ sys.path.insert(0, str(project_root))
 src_path = Path(__file__).parent
 sys.path.insert(0, str(src_path))
 
+logger = logging.getLogger(__name__)
+
 
 def _setup_console_for_pyinstaller():
     """Fix PyInstaller console issues that cause 'NoneType' write errors."""
@@ -39,19 +42,19 @@ def _setup_console_for_pyinstaller():
 
 def main():
     """Main entry point for DDT"""
-    print("DEBUG: Starting main()")
+    logger.debug("Starting main()")
 
     # Fix PyInstaller console issues BEFORE importing anything
     _setup_console_for_pyinstaller()
-    print("DEBUG: Console setup complete")
+    logger.debug("Console setup complete")
     try:
         from core.application_controller import run_application
 
-        print("DEBUG: Import successful, calling run_application()")
+        logger.debug("Import successful, calling run_application()")
         run_application()
-        print("DEBUG: run_application() completed")
+        logger.debug("run_application() completed")
     except Exception as e:
-        print(f"DEBUG: Exception in main(): {e}")
+        logger.debug("Exception in main(): %s", e)
         import traceback
 
         traceback.print_exc()
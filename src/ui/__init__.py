@@ -9,10 +9,25 @@ and screens for DDT.
 - IncidentViewer
 """
 
-from .components.file_selector import FileSelector
-from .components.custom_graph import CustomGraph
-from .components.preset_graph import PresetGraph
-from .components.incident_viewer import IncidentViewer
-from .screen.main_window import MainWindow
+import importlib
+
+# Exported name -> defining module; each is imported when first read, so
+# importing one component doesn't load every screen
+_LAZY_EXPORTS = {
+    "FileSelector": ".components.file_selector",
+    "CustomGraph": ".components.custom_graph",
+    "PresetGraph": ".components.preset_graph",
+    "IncidentViewer": ".components.incident_viewer",
+    "MainWindow": ".screen.main_window",
+}
 
 __all__ = ["MainWindow", "FileSelector", "CustomGraph", "PresetGraph", "IncidentViewer"]
+
+
+def __getattr__(name):
+    """Import UI components only when they are first read."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value  # Later reads skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,6 @@
 """Custom graph component to show a listbox of IO points for selection."""
 
+from itertools import chain
 from typing import Callable
 
 import customtkinter as ctk
@@ -19,6 +20,10 @@ class CustomGraph(ctk.CTkFrame):
         self.callbacks = {}
         self.checkboxes = []
 
+        # Variables of the checked boxes by Tcl name (StringVar isn't hashable),
+        # kept current by a trace on each
+        self._checked = {}
+
         self.setup_component()
 
     def setup_component(self) -> None:
@@ -31,93 +36,78 @@ class CustomGraph(ctk.CTkFrame):
         component_listbox.grid_columnconfigure(0, weight=1)
         component_listbox.grid_columnconfigure(1, weight=1)
 
-        row = 0
-        col = 0
-
-        # Populate frame with IO points
-        for key, value in IO_POINTS.items():
-            io_point_var = ctk.StringVar(value="off")
-            self.io_state[key] = io_point_var
-            io_point_checkbox = ctk.CTkCheckBox(
-                component_listbox,
-                text=value["readable_name"],
-                font=ctk.CTkFont(family="Inter", size=14, weight="bold"),
-                width=18,
-                height=18,
-                checkbox_width=16,
-                checkbox_height=16,
-                variable=io_point_var,
-                onvalue="on",
-                offvalue="off",
-                fg_color=UI_COLORS["checkbox"],
-                hover_color=UI_COLORS["checkbox_hover"],
-                corner_radius=3,
-                border_width=1,
-                text_color=UI_COLORS["white"],
-            )
-            io_point_checkbox.grid(
-                row=row,
-                column=col,
-                padx=UI_PADDING["small"],
-                pady=UI_PADDING["small"],
-                sticky="ew",  # Expand horizontally to fill column
-            )
-            self.checkboxes.append(io_point_checkbox)
-
-            # Move to next column, wrap to next row after 3 columns
-            col += 1
-            if col >= 2:
-                col = 0
-                row += 1
-
-        # Populate frame with VFD points
-        for key, value in VFD_POINTS.items():
-            vfd_point_var = ctk.StringVar(value="off")
-            self.vfd_state[key] = vfd_point_var
-            vfd_point_checkbox = ctk.CTkCheckBox(
+        # One font and one set of options shared by every checkbox
+        checkbox_options = dict(
+            font=ctk.CTkFont(family="Inter", size=14, weight="bold"),
+            width=18,
+            height=18,
+            checkbox_width=16,
+            checkbox_height=16,
+            onvalue="on",
+            offvalue="off",
+            fg_color=UI_COLORS["checkbox"],
+            hover_color=UI_COLORS["checkbox_hover"],
+            corner_radius=3,
+            border_width=1,
+            text_color=UI_COLORS["white"],
+        )
+
+        # Populate frame with IO points, then VFD points: (state, key, label)
+        points = chain(
+            (
+                (self.io_state, key, value["readable_name"])
+                for key, value in IO_POINTS.items()
+            ),
+            ((self.vfd_state, key, key) for key in VFD_POINTS),
+        )
+
+        for index, (state, key, text) in enumerate(points):
+            point_var = ctk.StringVar(value="off")
+            point_var.trace_add("write", self._checked_tracker(point_var))
+            state[key] = point_var
+            point_checkbox = ctk.CTkCheckBox(
                 component_listbox,
-                text=key,
-                font=ctk.CTkFont(family="Inter", size=14, weight="bold"),
-                width=18,
-                height=18,
-                checkbox_width=16,
-                checkbox_height=16,
-                variable=vfd_point_var,
-                onvalue="on",
-                offvalue="off",
-                fg_color=UI_COLORS["checkbox"],
-                hover_color=UI_COLORS["checkbox_hover"],
-                corner_radius=3,
-                border_width=1,
-                text_color=UI_COLORS["white"],
+                text=text,
+                variable=point_var,
+                **checkbox_options,
             )
-            vfd_point_checkbox.grid(
-                row=row,
-                column=col,
+
+            # Fill two columns, wrapping to the next row
+            point_checkbox.grid(
+                row=index // 2,
+                column=index % 2,
                 padx=UI_PADDING["small"],
                 pady=UI_PADDING["small"],
                 sticky="ew",  # Expand horizontally to fill column
             )
-            self.checkboxes.append(vfd_point_checkbox)
+            self.checkboxes.append(point_checkbox)
+
+    def _checked_tracker(self, var: ctk.StringVar) -> Callable:
+        """
+        Build a trace callback that keeps the checked set in step with a variable.
+
+        Parameters:
+          var (ctk.StringVar): Checkbox variable
+
+        Returns:
+          Callable: Callback for var.trace_add("write", ...)
+        """
 
-            # Move to next column, wrap to next row after 3 columns
-            col += 1
-            if col >= 2:
-                col = 0
-                row += 1
+        def on_write(*_) -> None:
+            if var.get() == "on":
+                self._checked[str(var)] = var
+            else:
+                self._checked.pop(str(var), None)
+
+        return on_write
 
     def clear(self) -> None:
         """Clear all selected checkboxes"""
 
-        count = 0
+        count = len(self._checked)
 
-        for var in self.io_state.values():
-            if var.get() == "on":
-                count += 1
-            var.set("off")
-        for var in self.vfd_state.values():
-            if var.get() == "on":
-                count += 1
+        # Only checked boxes need resetting; each write updates the set
+        for var in list(self._checked.values()):
             var.set("off")
 
         if "cleared_custom_points" in self.callbacks:
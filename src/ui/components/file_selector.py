@@ -2,14 +2,24 @@
 
 import os
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, messagebox
-from typing import Callable, List
+from typing import Callable, Dict, List
 
 import customtkinter as ctk
 
 from util.file_util import get_file_size, cleanup_data_directory
 from util.validation import validate_file_exists, validate_file_extension
-from config.constants import DATA_FOLDER_PATH
+from config.constants import get_data_folder_path
+
+# Files in the data folder left over from a previous merge
+_DB_EXTS = (".db", ".sqlite", ".xml")
+
+# Extensions accepted without asking
+_VALID_EXTENSIONS = (".db", ".sqlite", ".sqlite3", ".lz4")
+
+# Concurrent existence checks; each stat waits on the disk or network share
+VALIDATION_WORKERS = 16
 
 
 class FileSelector(ctk.CTkFrame):
@@ -21,6 +31,9 @@ class FileSelector(ctk.CTkFrame):
         self.selected_files = []
         self.callbacks = {}
 
+        # Formatted list rows, built once when each file is added
+        self._display_cache: Dict[str, str] = {}
+
         self.setup_ui()
 
     def setup_ui(self) -> None:
@@ -93,9 +106,10 @@ class FileSelector(ctk.CTkFrame):
         if not file_paths:
             return
 
+        # The data folder was checked above, once for the whole batch
         added_count = 0
         for file_path in file_paths:
-            if self.add_single_file(file_path):
+            if self._add_single_file_unchecked(file_path):
                 added_count += 1
 
         if added_count > 0:
@@ -124,7 +138,20 @@ class FileSelector(ctk.CTkFrame):
                 f"Please delete the existing database files first: \n{file_list}\n\n"
                 f"Use the 'Delete Data Folder Contents' button to remove them.",
             )
-            return
+            return False
+
+        return self._add_single_file_unchecked(file_path)
+
+    def _add_single_file_unchecked(self, file_path: str) -> bool:
+        """
+        Validate and add a single file, without checking the data folder.
+
+        Parameters:
+          file_path(str): Path to the file to add
+
+        Returns:
+          bool: True if file was added, False otherwise
+        """
 
         # Validate file
         if not validate_file_exists(file_path):
@@ -139,8 +166,7 @@ class FileSelector(ctk.CTkFrame):
             return False
 
         # Validate file extension (optional)
-        valid_extensions = [".db", ".sqlite", ".sqlite3", ".lz4"]
-        is_valid, error_msg = validate_file_extension(file_path, valid_extensions)
+        is_valid, error_msg = validate_file_extension(file_path, _VALID_EXTENSIONS)
         if not is_valid:
             result = messagebox.askyesno("Warning", f"{error_msg}\n\nAdd file anyway?")
             if not result:
@@ -148,6 +174,7 @@ class FileSelector(ctk.CTkFrame):
 
         # Add to list
         self.selected_files.append(file_path)
+        self._display_cache[file_path] = self.format_file_display(file_path)
         return True
 
     def remove_selected_files(self) -> None:
@@ -157,12 +184,17 @@ class FileSelector(ctk.CTkFrame):
             messagebox.showinfo("Info", "No files selected for removal.")
             return
 
-        # Remove files (reverse order to maintain indices)
+        # Rebuild the list once rather than popping each index
+        removed = set(selected_indices)
+        kept_files = []
         removed_count = 0
-        for index in reversed(selected_indices):
-            if 0 <= index < len(self.selected_files):
-                self.selected_files.pop(index)
+        for index, file_path in enumerate(self.selected_files):
+            if index in removed:
+                self._display_cache.pop(file_path, None)
                 removed_count += 1
+            else:
+                kept_files.append(file_path)
+        self.selected_files[:] = kept_files
 
         self.refresh_display()
 
@@ -182,6 +214,7 @@ class FileSelector(ctk.CTkFrame):
         if result:
             count = len(self.selected_files)
             self.selected_files.clear()
+            self._display_cache.clear()
             self.refresh_display()
 
             if "files_cleared" in self.callbacks:
@@ -190,7 +223,7 @@ class FileSelector(ctk.CTkFrame):
     def delete_database_file(self) -> None:
         """Delete merged database file."""
 
-        files_in_directory = os.listdir(DATA_FOLDER_PATH)
+        files_in_directory = os.listdir(get_data_folder_path())
 
         if not files_in_directory:
             messagebox.showinfo("Info", "No files found to delete.")
@@ -199,7 +232,7 @@ class FileSelector(ctk.CTkFrame):
         # Confirm deletion
         result = messagebox.askyesno(
             "Confirm Delete",
-            f"Are you sure you want to delete the data folder contents?\n\n{DATA_FOLDER_PATH}",
+            f"Are you sure you want to delete the data folder contents?\n\n{get_data_folder_path()}",
         )
 
         if not result:
@@ -219,20 +252,23 @@ class FileSelector(ctk.CTkFrame):
     def _attempt_file_deletion(self) -> None:
         """Attempt to delete the database file after cleanup."""
         try:
+            # Collect the files first so the directory handle is closed
+            # before anything in it is removed
+            try:
+                with os.scandir(get_data_folder_path()) as entries:
+                    file_paths = [
+                        entry.path for entry in entries if entry.name.endswith(_DB_EXTS)
+                    ]
+            except FileNotFoundError:
+                file_paths = []
+
             # Delete the main database file
-            if os.path.exists(DATA_FOLDER_PATH):
-                for filename in os.listdir(DATA_FOLDER_PATH):
-                    if (
-                        filename.endswith(".db")
-                        or filename.endswith(".sqlite")
-                        or filename.endswith(".xml")
-                    ):
-                        file_path = os.path.join(DATA_FOLDER_PATH, filename)
-                        try:
-                            os.remove(file_path)
-                            pass
-                        except Exception as e:
-                            pass
+            for file_path in file_paths:
+                try:
+                    os.remove(file_path)
+                    pass
+                except Exception as e:
+                    pass
 
             if "database_deleted" in self.callbacks:
                 self.callbacks["database_deleted"]()
@@ -250,13 +286,19 @@ class FileSelector(ctk.CTkFrame):
 
     def refresh_display(self) -> None:
         """Refresh the file list display."""
+        # Rows were formatted on add, so the Listbox gets a single insert call
+        display_cache = self._display_cache
+        display_texts = [
+            display_cache.get(file_path) or self.format_file_display(file_path)
+            for file_path in self.selected_files
+        ]
+
         # Clear current display
         self.file_listbox.delete(0, tk.END)
 
         # Add files with formatted display
-        for file_path in self.selected_files:
-            display_text = self.format_file_display(file_path)
-            self.file_listbox.insert(tk.END, display_text)
+        if display_texts:
+            self.file_listbox.insert(tk.END, *display_texts)
 
     def format_file_display(self, file_path: str) -> str:
         """
@@ -346,6 +388,10 @@ class FileSelector(ctk.CTkFrame):
         directory = os.path.dirname(file_path)
         file_size = get_file_size(file_path)
 
+        # Read fresh on request; keep the list's row in step with it
+        if file_path in self._display_cache:
+            self._display_cache[file_path] = self.format_file_display(file_path)
+
         try:
             modified_time = os.path.getmtime(file_path)
             import datetime
@@ -383,13 +429,20 @@ Full Path: {file_path}"""
         Returns:
           List[str]: List of invalid file paths.
         """
-        invalid_files = []
+        file_paths = list(self.selected_files)
+        if not file_paths:
+            return []
 
-        for file_path in self.selected_files:
-            if not validate_file_exists(file_path):
-                invalid_files.append(file_path)
+        with ThreadPoolExecutor(
+            max_workers=min(VALIDATION_WORKERS, len(file_paths))
+        ) as executor:
+            exists = list(executor.map(validate_file_exists, file_paths))
 
-        return invalid_files
+        return [
+            file_path
+            for file_path, file_exists in zip(file_paths, exists)
+            if not file_exists
+        ]
 
     def remove_invalid_files(self) -> int:
         """
@@ -404,10 +457,13 @@ Full Path: {file_path}"""
         if not invalid_files:
             return 0
 
-        # Remove invalid files
-        for file_path in invalid_files:
-            if file_path in self.selected_files:
-                self.selected_files.remove(file_path)
+        # Remove invalid files in one pass over the selection
+        invalid = set(invalid_files)
+        self.selected_files[:] = [
+            file_path for file_path in self.selected_files if file_path not in invalid
+        ]
+        for file_path in invalid:
+            self._display_cache.pop(file_path, None)
 
         self.refresh_display()
         return len(invalid_files)
@@ -419,18 +475,12 @@ Full Path: {file_path}"""
         Returns:
             tuple: (has_db_files, list_db_files)
         """
-        if not os.path.exists(DATA_FOLDER_PATH):
-            return False, []
-
+        # A missing folder raises FileNotFoundError, an OSError
         try:
-            database_files = []
-            for filename in os.listdir(DATA_FOLDER_PATH):
-                if (
-                    filename.endswith(".db")
-                    or filename.endswith(".sqlite")
-                    or filename.endswith(".xml")
-                ):
-                    database_files.append(filename)
+            with os.scandir(get_data_folder_path()) as entries:
+                database_files = [
+                    entry.name for entry in entries if entry.name.endswith(_DB_EXTS)
+                ]
 
             return len(database_files) > 0, database_files
         except OSError:
@@ -1,11 +1,36 @@
 """Incident viewer component."""
 
+import operator
+import tkinter as tk
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+
 import customtkinter as ctk
-from typing import Callable, List, Dict
+import numpy as np
+from typing import Callable, List, Dict, Optional
 
 
 from config.ui_config import UI_PADDING, UI_COLORS
 
+# Longest substring indexed per word; longer terms intersect these grams
+_GRAM_SIZE = 3
+
+# Recent search results kept, for retyped and backspaced queries
+QUERY_CACHE_SIZE = 32
+
+# How often the Tk thread checks a running search for its results
+SEARCH_POLL_MS = 10
+
+# Rows built past each edge of the view, so short scrolls land on filled rows
+_OVERSCAN_ROWS = 5
+
+# Space above and below each row
+_ROW_PADY = 2
+
+# Rows scrolled per mouse wheel step
+_WHEEL_ROWS = 3
+
 
 class IncidentViewer(ctk.CTkFrame):
     """Incident viewer component and search box."""
@@ -22,10 +47,57 @@ class IncidentViewer(ctk.CTkFrame):
         self.search_mode = "text"
         self.search_timer = None
         self.search_delay = 300  # Milliseconds
-        self.widget_pool = []
-        self.active_widgets = []
-        self.max_pool_size = 100
+
+        # Search text the view last reflects; None forces the next search to run
+        self._last_query = None
+
+        # Searches run on one worker so typing never waits on them; only the
+        # latest is applied, and the Tk thread polls for it
+        self._search_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="IncidentSearch"
+        )
+        self._search_future: Optional[Future] = None
+        self._search_poll_job = None
+
+        # Pending highlight-and-scroll pass, and the row it last highlighted
+        self._occurrence_job = None
+        self._highlighted_index = None
+
+        # Only rows in view exist; active_widgets maps render index -> row
+        self.widget_pool = deque()
+        self.active_widgets = {}
+        self.shown_incidents = []
+        self._canvas = None
+        self._scrollbar = None
+        self._row_height = None  # Row pitch in pixels, measured on first render
+
+        # View geometry as last reported by Tk, so scrolling needs no queries
+        self._canvas_width = 0
+        self._canvas_height = 0
+        self._view_top = 0.0  # Top of the view as a fraction of the list
+
+        # Shared by every row's buttons and set once when the row is built
+        self._row_font = ctk.CTkFont(family="Inter", size=18, weight="bold")
+
+        # Reused by every help dialog
+        self._help_text_font = ctk.CTkFont(family="Inter", size=14)
+        self._help_button_font = ctk.CTkFont(family="Inter", size=14, weight="bold")
+
         self.search_index = {}
+
+        # Lowercased searchable text per incident, aligned with all_incidents
+        self._lower_text = []
+
+        # Every 1..3 character substring -> vocabulary words containing it
+        self._trigram_index = {}
+
+        # Normalized query -> matching indices, most recent last
+        self._query_cache = OrderedDict()
+
+        # Last query fast_search answered and its matches, for typed-on queries
+        self._last_search = None
+        self._last_result = []
+
         self.setup_component()
 
     def setup_component(self) -> None:
@@ -56,7 +128,7 @@ class IncidentViewer(ctk.CTkFrame):
         )
 
         # Frame for incidents
-        self.incident_listbox = ctk.CTkScrollableFrame(self)
+        self.incident_listbox = ctk.CTkFrame(self)
         self.incident_listbox.grid(
             row=1,
             column=0,
@@ -64,6 +136,28 @@ class IncidentViewer(ctk.CTkFrame):
             padx=UI_PADDING["small"],
             pady=UI_PADDING["small"],
         )
+        self.incident_listbox.grid_rowconfigure(0, weight=1)
+        self.incident_listbox.grid_columnconfigure(0, weight=1)
+
+        # Rows are canvas windows placed by index, so the list can be scrolled
+        # without building a widget for every incident
+        self._canvas = tk.Canvas(
+            self.incident_listbox,
+            highlightthickness=0,
+            borderwidth=0,
+            bg=self.incident_listbox._apply_appearance_mode(
+                self.incident_listbox.cget("fg_color")
+            ),
+        )
+        self._scrollbar = ctk.CTkScrollbar(
+            self.incident_listbox, command=self._canvas.yview
+        )
+        self._canvas.configure(yscrollcommand=self.on_canvas_scrolled)
+        self._canvas.grid(row=0, column=0, sticky="nsew", padx=(5, 0), pady=5)
+        self._scrollbar.grid(row=0, column=1, sticky="ns", padx=(0, 5), pady=5)
+
+        self._canvas.bind("<Configure>", self.on_canvas_configure)
+        self._bind_mouse_wheel(self._canvas)
 
         if self.search_mode == "occurrence":
             self.search_box.bind("<Return>", self.on_search_enter)
@@ -86,6 +180,7 @@ class IncidentViewer(ctk.CTkFrame):
 
         # Store all incidents
         self.all_incidents = incidents
+        self._last_query = None
 
         self.build_search_index()
 
@@ -94,19 +189,69 @@ class IncidentViewer(ctk.CTkFrame):
 
     def build_search_index(self) -> None:
         """Build search index for faster searching."""
+        # The worker reads and caches into the index, so let it finish first
+        self._finish_search()
+
         self.search_index = {}
+        self._trigram_index = {}
+        self._query_cache.clear()
+        self._last_search = None
+        self._last_result = []
+
+        # Combine searchable text
+        self._lower_text = [
+            f"{incident.get("text", "")} {incident.get("timestamp", "")}".lower()
+            for incident in self.all_incidents
+        ]
+
+        postings = defaultdict(list)
+        for i, searchable_text in enumerate(self._lower_text):
+            # Each word once per incident, so every append is a new index
+            for word in set(searchable_text.split()):
+                postings[word].append(i)
+
+        # Sorted index arrays intersect in C rather than through set hashing
+        self.search_index = {
+            word: np.array(indices, dtype=np.int32)
+            for word, indices in postings.items()
+        }
+
+        # Map substrings to words so partial matches skip the vocabulary scan
+        for word in self.search_index:
+            grams = {
+                word[start : start + size]
+                for size in range(1, _GRAM_SIZE + 1)
+                for start in range(len(word) - size + 1)
+            }
+            for gram in grams:
+                if gram not in self._trigram_index:
+                    self._trigram_index[gram] = set()
+                self._trigram_index[gram].add(word)
+
+    def _words_containing(self, term: str) -> set:
+        """
+        Find indexed words that contain a search term.
 
-        for i, incident in enumerate(self.all_incidents):
-            # Combine searchable text
-            searchable_text = (
-                f"{incident.get("text", "")} {incident.get("timestamp", "")}".lower()
-            )
+        Parameters:
+            term (str): Lowercased search term
 
-            words = searchable_text.split()
-            for word in words:
-                if word not in self.search_index:
-                    self.search_index[word] = set()
-                self.search_index[word].add(i)
+        Returns:
+            set: Vocabulary words with the term as a substring
+        """
+        if len(term) <= _GRAM_SIZE:
+            return self._trigram_index.get(term, set())
+
+        # A word holding the term holds each of its grams; check the survivors
+        gram_words = []
+        for start in range(len(term) - _GRAM_SIZE + 1):
+            words = self._trigram_index.get(term[start : start + _GRAM_SIZE])
+            if not words:
+                return set()
+            gram_words.append(words)
+
+        gram_words.sort(key=len)
+        candidates = gram_words[0].intersection(*gram_words[1:])
+        return {word for word in candidates if term in word}
 
     def fast_search(self, search_text: str) -> List[int]:
         """Fast search using pre-built index."""
@@ -114,33 +259,73 @@ class IncidentViewer(ctk.CTkFrame):
         if not search_terms:
             return list(range(len(self.all_incidents)))
 
-        # Find incidents that match all search terms
-        matching_incidents = None
+        query = " ".join(search_terms)
+        result = self._query_cache.get(query)
+        if result is not None:
+            self._query_cache.move_to_end(query)
+        elif self._last_search and query.startswith(self._last_search):
+            # Typing on only narrows the terms, so recheck the last matches;
+            # a term is within one word exactly when it is within the text
+            lower_text = self._lower_text
+            result = [
+                index
+                for index in self._last_result
+                if all(term in lower_text[index] for term in search_terms)
+            ]
+        else:
+            result = self._index_search(search_terms)
 
-        for term in search_terms:
-            # Find incidents containing this term
-            term_matches = set()
+        self._query_cache[query] = result
+        if len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
 
-            # Check exact word matches first
-            if term in self.search_index:
-                term_matches.update(self.search_index[term])
+        self._last_search = query
+        self._last_result = result
+        return result
 
-            # Check partial word matches
-            for word, incidents in self.search_index.items():
-                if term in word:
-                    term_matches.update(incidents)
+    def _index_search(self, search_terms: List[str]) -> List[int]:
+        """
+        Find incidents matching every term through the word index.
 
-            # Intersect with previous results
-            if matching_incidents is None:
-                matching_incidents = term_matches
-            else:
-                matching_incidents = matching_incidents.intersection(term_matches)
+        Parameters:
+            search_terms (List[str]): Lowercased search terms
+
+        Returns:
+            List[int]: Sorted indices of matching incidents
+        """
+        # Find incidents containing each distinct term
+        per_term_sets = []
+        for term in dict.fromkeys(search_terms):
+            # Exact and partial word matches
+            postings = [
+                self.search_index[word] for word in self._words_containing(term)
+            ]
 
             # Early exit if no matches
-            if not matching_incidents:
+            if not postings:
+                return []
+
+            if len(postings) == 1:
+                term_matches = postings[0]
+            else:
+                # Mark every posting in a mask rather than sorting the union
+                mask = np.zeros(len(self.all_incidents), dtype=bool)
+                for indices in postings:
+                    mask[indices] = True
+                term_matches = np.flatnonzero(mask)
+            per_term_sets.append(term_matches)
+
+        # Intersect smallest first so the working set only shrinks
+        per_term_sets.sort(key=len)
+        matching_incidents = per_term_sets[0]
+        for term_matches in per_term_sets[1:]:
+            matching_incidents = np.intersect1d(
+                matching_incidents, term_matches, assume_unique=True
+            )
+            if not len(matching_incidents):
                 break
 
-        return sorted(list(matching_incidents or set()))
+        return matching_incidents.tolist()
 
     def render_incidents(self, incidents_to_show: List[Dict]) -> None:
         """
@@ -150,24 +335,118 @@ class IncidentViewer(ctk.CTkFrame):
             incidents_to_show (List[Dict]): Incidents to display
         """
 
+        # Same incidents in the same order: refresh the rows in place and
+        # keep the scroll position
+        if len(incidents_to_show) == len(self.shown_incidents) and all(
+            map(operator.is_, incidents_to_show, self.shown_incidents)
+        ):
+            self.shown_incidents = incidents_to_show
+            for render_index, widget in self.active_widgets.items():
+                self.configure_incident_widget(
+                    widget, incidents_to_show[render_index], render_index
+                )
+            return
+
         # Hide widgets
-        for widget in self.active_widgets:
-            widget.pack_forget()
+        for widget in self.active_widgets.values():
+            self._canvas.itemconfigure(widget.window_id, state="hidden")
+
+        # Return widgets to pool; it only ever holds a viewport's worth, so
+        # nothing is destroyed until the incidents are cleared
+        self.widget_pool.extend(self.active_widgets.values())
+        self.active_widgets = {}
+
+        self.shown_incidents = incidents_to_show
+        if incidents_to_show and self._row_height is None:
+            self._row_height = self._measure_row_height(incidents_to_show[0])
+            self._canvas.configure(yscrollincrement=self._row_height)
+
+        # Size the scroll area for every incident, then fill in the visible rows
+        total_height = len(incidents_to_show) * (self._row_height or 0)
+        self._canvas.configure(scrollregion=(0, 0, 0, total_height))
+        self._canvas.yview_moveto(0)
+        self._view_top = 0.0
+        self.update_visible_rows()
+
+    def update_visible_rows(self) -> None:
+        """Build rows for the incidents in view and pool the rest."""
+        total = len(self.shown_incidents)
+        row_height = self._row_height
+        if not total or not row_height:
+            return
 
-        # Return widgets to pool
-        self.widget_pool.extend(self.active_widgets)
-        self.active_widgets = []
+        top = int(self._view_top * total * row_height)
+        bottom = top + self._canvas_height
+        first = max(0, top // row_height - _OVERSCAN_ROWS)
+        last = min(total, bottom // row_height + 1 + _OVERSCAN_ROWS)
 
-        while len(self.widget_pool) > self.max_pool_size:
-            widget = self.widget_pool.pop(0)
-            widget.destroy()
+        # Hide rows scrolled out of range and return them to the pool
+        for render_index in [
+            index for index in self.active_widgets if not first <= index < last
+        ]:
+            widget = self.active_widgets.pop(render_index)
+            self._canvas.itemconfigure(widget.window_id, state="hidden")
+            self.widget_pool.append(widget)
 
-        # Render filtered incidents
-        for render_index, incident in enumerate(incidents_to_show):
+        # Render incidents scrolled into range
+        for render_index in range(first, last):
+            if render_index in self.active_widgets:
+                continue
 
             incident_row = self.get_or_create_incident_widget()
-            self.configure_incident_widget(incident_row, incident, render_index)
-            self.active_widgets.append(incident_row)
+            self.configure_incident_widget(
+                incident_row, self.shown_incidents[render_index], render_index
+            )
+            self._canvas.coords(
+                incident_row.window_id, 0, render_index * row_height + _ROW_PADY
+            )
+            self._canvas.itemconfigure(incident_row.window_id, state="normal")
+            self.active_widgets[render_index] = incident_row
+
+    def _measure_row_height(self, incident: Dict) -> int:
+        """
+        Measure the row pitch from one configured row.
+
+        Parameters:
+            incident (Dict): Incident to fill the probe row with
+
+        Returns:
+            int: Row height plus padding, in pixels
+        """
+        probe = self.get_or_create_incident_widget()
+        self.configure_incident_widget(probe, incident, -1)
+        probe.update_idletasks()
+        self.widget_pool.append(probe)
+        return probe.winfo_reqheight() + 2 * _ROW_PADY
+
+    def on_canvas_scrolled(self, first: str, last: str) -> None:
+        """Move the scrollbar and fill in rows when the view scrolls."""
+        self._scrollbar.set(first, last)
+        self._view_top = float(first)
+        self.update_visible_rows()
+
+    def on_canvas_configure(self, event) -> None:
+        """Stretch rows to the canvas width and fill in rows on resize."""
+        self._canvas_width = event.width
+        self._canvas_height = event.height
+        for widget in chain(self.active_widgets.values(), self.widget_pool):
+            self._canvas.itemconfigure(widget.window_id, width=event.width)
+        self.update_visible_rows()
+
+    def _bind_mouse_wheel(self, widget) -> None:
+        """Scroll the incident list when the mouse wheel turns over a widget."""
+        widget.bind("<MouseWheel>", self.on_mouse_wheel)
+        widget.bind("<Button-4>", self.on_mouse_wheel)
+        widget.bind("<Button-5>", self.on_mouse_wheel)
+
+    def on_mouse_wheel(self, event) -> None:
+        """Handle mouse wheel over the incident list."""
+        # Linux reports the wheel as buttons 4/5, others as a signed delta
+        if event.num == 4 or event.delta > 0:
+            direction = -1
+        else:
+            direction = 1
+        self._canvas.yview_scroll(direction * _WHEEL_ROWS, "units")
 
     def get_or_create_incident_widget(self):
         """Get widget from pool or create a new one."""
@@ -178,52 +457,81 @@ class IncidentViewer(ctk.CTkFrame):
 
     def create_incident_widget(self):
         """Create a new incident widget structure."""
-        incident_row = ctk.CTkFrame(self.incident_listbox, fg_color="transparent")
+        incident_row = ctk.CTkFrame(self._canvas, fg_color="transparent")
         incident_row.grid_columnconfigure(1, weight=1)
 
+        # The command reads whichever incident the row shows, so it is set once
+        incident_row.incident_ref = None
+
+        def show_row_help() -> None:
+            self.show_help_text(incident_row.incident_ref["help_text"])
+
         # Create timestamp button
-        timestamp_label = ctk.CTkButton(incident_row, corner_radius=0)
+        timestamp_label = ctk.CTkButton(
+            incident_row, corner_radius=0, font=self._row_font, command=show_row_help
+        )
         timestamp_label.grid(row=0, column=0, sticky="w", padx=(5, 0), pady=2)
 
         # Create incident button
-        incident_label = ctk.CTkButton(incident_row, corner_radius=0)
+        incident_label = ctk.CTkButton(
+            incident_row, corner_radius=0, font=self._row_font, command=show_row_help
+        )
         incident_label.grid(row=0, column=1, sticky="ew", pady=2)
 
         # Store references for easy access
         incident_row.timestamp_btn = timestamp_label
         incident_row.incident_btn = incident_label
 
+        # Current look, so reconfiguring skips attributes that didn't change
+        incident_row.highlighted = False
+        incident_row.colors = None
+
+        # Placed by update_visible_rows; hidden while pooled
+        incident_row.window_id = self._canvas.create_window(
+            0,
+            0,
+            window=incident_row,
+            anchor="nw",
+            width=self._canvas_width,
+            state="hidden",
+        )
+
+        for widget in (incident_row, timestamp_label, incident_label):
+            self._bind_mouse_wheel(widget)
+
         return incident_row
 
     def configure_incident_widget(self, widget, incident, render_index):
         """Configure existing widget with new incident data."""
         # Update highlighting
-        is_highlighted = self.should_highlight_incident(render_index, incident)
-        bg_color = "yellow" if is_highlighted else "transparent"
-        widget.configure(fg_color=bg_color)
+        self._set_row_highlight(
+            widget, self.should_highlight_incident(render_index, incident)
+        )
+
+        widget.incident_ref = incident
+
+        # Each button gets one configure call, so it redraws once
+        button_attrs = {}
+        colors = (incident["label_color"], incident["text_color"])
+        if colors != widget.colors:
+            widget.colors = colors
+            button_attrs.update(
+                fg_color=incident["label_color"],
+                hover_color=incident["label_color"],
+                text_color=incident["text_color"],
+            )
 
         # Update timestamp button
-        widget.timestamp_btn.configure(
-            text=incident["timestamp"],
-            font=ctk.CTkFont(family="Inter", size=18, weight="bold"),
-            fg_color=incident["label_color"],
-            hover_color=incident["label_color"],
-            text_color=incident["text_color"],
-            command=lambda: self.show_help_text(incident["help_text"]),
-        )
+        widget.timestamp_btn.configure(text=incident["timestamp"], **button_attrs)
 
         # Update incident button
-        widget.incident_btn.configure(
-            text=incident["text"],
-            font=ctk.CTkFont(family="Inter", size=18, weight="bold"),
-            fg_color=incident["label_color"],
-            hover_color=incident["label_color"],
-            text_color=incident["text_color"],
-            command=lambda: self.show_help_text(incident["help_text"]),
-        )
+        widget.incident_btn.configure(text=incident["text"], **button_attrs)
 
-        # Show the widget
-        widget.pack(fill="x", pady=2)
+    def _set_row_highlight(self, widget, highlighted: bool) -> None:
+        """Set a row's highlight, skipping the redraw if it is unchanged."""
+        if widget.highlighted != highlighted:
+            widget.highlighted = highlighted
+            widget.configure(fg_color="yellow" if highlighted else "transparent")
 
     def should_highlight_incident(self, render_index: int, incident: Dict) -> bool:
         """Determine if incident should be hightlighted."""
@@ -233,39 +541,92 @@ class IncidentViewer(ctk.CTkFrame):
         if not self.current_search_results:
             return False
 
-        actual_incident_index = render_index
-
+        # Only the current occurrence is highlighted; it is always a result
         return (
-            actual_incident_index in self.current_search_results
-            and actual_incident_index
-            == self.current_search_results[self.current_occurrence_index]
+            render_index == self.current_search_results[self.current_occurrence_index]
         )
 
     def on_search_changed(self, *args) -> None:
         """Handle search changes and filter incidents."""
 
         # Cancel existing
-        if self.search_timer is not None:
-            self.after_cancel(self.search_timer)
+        self._cancel_search_timer()
 
         # Set a new timer to execute after delay
         self.search_timer = self.after(self.search_delay, self.execute_search)
 
+    def _cancel_search_timer(self) -> None:
+        """Cancel the pending search, if any."""
+        if self.search_timer is not None:
+            self.after_cancel(self.search_timer)
+            self.search_timer = None
+
     def execute_search(self) -> None:
         """Execute the actual search after delay."""
+        self.search_timer = None
         search_text = self.search_var.get().lower().strip()
 
+        # Edits that leave the query unchanged (e.g. trailing spaces) need no work
+        if search_text == self._last_query:
+            return
+        self._last_query = search_text
+
         if not search_text:
+            self._discard_search()
             if self.search_mode == "text":
                 # Show all incidents if search is empty
                 self.render_incidents(self.all_incidents)
             self.current_search_results = []
             self.current_occurrence_index = 0
+            if self.search_mode == "occurrence":
+                self._schedule_occurrence_view()
             return
 
-        # Use fast indexed search
-        matching_indices = self.fast_search(search_text)
+        # Use fast indexed search off the Tk thread; a pending one is superseded
+        if self._search_future is not None:
+            self._search_future.cancel()
+        self._search_future = self._search_executor.submit(
+            self.fast_search, search_text
+        )
+        if self._search_poll_job is None:
+            self._search_poll_job = self.after(SEARCH_POLL_MS, self._poll_search)
+
+    def _poll_search(self) -> None:
+        """Apply the latest search once its worker finishes."""
+        future = self._search_future
+        if not future.done():
+            self._search_poll_job = self.after(SEARCH_POLL_MS, self._poll_search)
+            return
+
+        self._search_poll_job = None
+        self._search_future = None
+        self._apply_search_results(future.result())
+
+    def _discard_search(self) -> None:
+        """Drop the pending search so its results are never applied."""
+        if self._search_poll_job is not None:
+            self.after_cancel(self._search_poll_job)
+            self._search_poll_job = None
+
+        if self._search_future is not None:
+            self._search_future.cancel()
+            self._search_future = None
+
+    def _finish_search(self) -> None:
+        """Drop the pending search and wait until the worker is idle."""
+        self._discard_search()
 
+        # The single worker runs jobs in order, so once this no-op has run
+        # nothing is left reading the index
+        self._search_executor.submit(lambda: None).result()
+
+    def _apply_search_results(self, matching_indices: List[int]) -> None:
+        """
+        Show the results of a search in the current mode.
+
+        Parameters:
+            matching_indices (List[int]): Indices of matching incidents
+        """
         if self.search_mode == "text":
 
             # Text filtering mode = show only matching incidents
@@ -279,14 +640,11 @@ class IncidentViewer(ctk.CTkFrame):
             self.current_occurrence_index = 0
 
             # Only re-render if not already showing all incidents
-            if len(self.active_widgets) != len(self.all_incidents):
+            if self.shown_incidents is not self.all_incidents:
                 self.render_incidents(self.all_incidents)
 
             # Highlight first occurrence
-            if self.current_search_results:
-                self.update_highlighting(-1, 0)
-                incident_index = self.current_search_results[0]
-                self.after(10, lambda: self.scroll_to_incident(incident_index))
+            self._schedule_occurrence_view()
 
     def jump_to_occurrence(self, occurrence_index: int) -> None:
         """Jump to specific occurrence."""
@@ -295,16 +653,44 @@ class IncidentViewer(ctk.CTkFrame):
         ):
             return
 
-        old_index = self.current_occurrence_index
         self.current_occurrence_index = occurrence_index
 
-        # Update highlighting
-        self.update_highlighting(old_index, occurrence_index)
+        # Update highlighting and scroll to the incident
+        self._schedule_occurrence_view()
 
-        incident_index = self.current_search_results[occurrence_index]
+    def _schedule_occurrence_view(self) -> None:
+        """Highlight and scroll to the current occurrence once Tk is idle."""
+        if self._occurrence_job is None:
+            self._occurrence_job = self.after_idle(self._commit_occurrence_view)
 
-        # Scroll to the incident
-        self.after(10, lambda: self.scroll_to_incident(incident_index))
+    def _cancel_occurrence_view(self) -> None:
+        """Cancel the pending highlight-and-scroll pass, if any."""
+        if self._occurrence_job is not None:
+            self.after_cancel(self._occurrence_job)
+            self._occurrence_job = None
+
+    def _commit_occurrence_view(self) -> None:
+        """Move the highlight to the current occurrence and scroll to it."""
+        self._occurrence_job = None
+
+        if self.current_search_results:
+            target = self.current_search_results[self.current_occurrence_index]
+        else:
+            target = None
+
+        # Only the rows losing and gaining the highlight change; rows built
+        # later pick it up in configure_incident_widget
+        if target != self._highlighted_index:
+            if self._highlighted_index in self.active_widgets:
+                self._set_row_highlight(
+                    self.active_widgets[self._highlighted_index], False
+                )
+            if target in self.active_widgets:
+                self._set_row_highlight(self.active_widgets[target], True)
+            self._highlighted_index = target
+
+        if target is not None:
+            self.scroll_to_incident(target)
 
     def on_search_enter(self, event) -> None:
         """Handle Enter key in search box - jump to next occurrence."""
@@ -318,30 +704,23 @@ class IncidentViewer(ctk.CTkFrame):
     def scroll_to_incident(self, incident_index: int) -> None:
         """Scroll to specific incident by index."""
 
-        if incident_index >= len(self.active_widgets):
+        if incident_index >= len(self.shown_incidents):
             return
 
         try:
-            target_widget = self.active_widgets[incident_index]
+            # Rows sit at fixed offsets, so the target may not be built yet
+            row_height = self._row_height
+            widget_y = incident_index * row_height
 
-            # Force update to get accurate positions
-            target_widget.update_idletasks()
+            canvas_height = self._canvas_height
+            total_height = len(self.shown_incidents) * row_height
 
-            widget_y = target_widget.winfo_y()
-            widget_height = target_widget.winfo_height()
+            if total_height > canvas_height:
+                # Center the widget in view; the canvas clamps at either end
+                center_y = widget_y + (row_height / 2) - (canvas_height / 2)
+                scroll_fraction = max(0, center_y) / total_height
 
-            if hasattr(self.incident_listbox, "_parent_canvas"):
-                canvas = self.incident_listbox._parent_canvas
-                canvas_height = canvas.winfo_height()
-                total_height = self.incident_listbox.winfo_reqheight()
-
-                if total_height > canvas_height:
-                    # Center the widget in view
-                    center_y = widget_y + (widget_height / 2) - (canvas_height / 2)
-                    scroll_fraction = center_y / (total_height - canvas_height)
-                    scroll_fraction = max(0, min(1, scroll_fraction))
-
-                    canvas.yview_moveto(scroll_fraction)
+                self._canvas.yview_moveto(scroll_fraction)
 
         except Exception as e:
             pass
@@ -350,6 +729,9 @@ class IncidentViewer(ctk.CTkFrame):
         """Set the search mode ('text' or 'occurrence')"""
         self.search_mode = mode
 
+        # The same query gives a different view in the other mode
+        self._last_query = None
+
         if mode == "occurrence":
             # Bind enter key for occurrence search
             self.search_box.bind("<Return>", self.on_search_enter)
@@ -394,7 +776,7 @@ class IncidentViewer(ctk.CTkFrame):
         # Help text in a textbox (supports wrapping)
         help_textbox = ctk.CTkTextbox(
             text_frame,
-            font=ctk.CTkFont(family="Inter", size=14),
+            font=self._help_text_font,
             wrap="word",  # Wrap at word boundaries
             height=200,
             state="normal",  # Allow insertion of text
@@ -409,33 +791,33 @@ class IncidentViewer(ctk.CTkFrame):
         close_button = ctk.CTkButton(
             help_dialog,
             text="Close",
-            font=ctk.CTkFont(family="Inter", size=14, weight="bold"),
+            font=self._help_button_font,
             command=help_dialog.destroy,
         )
         close_button.grid(row=1, column=0, pady=(10, 20))
 
-    def update_highlighting(self, old_index: int, new_index: int) -> None:
-        """Update highlighting without re-render."""
-        # Remove old highlight
-        if old_index >= 0 and old_index < len(self.current_search_results):
-            old_incident_idx = self.current_search_results[old_index]
-            if old_incident_idx < len(self.active_widgets):
-                self.active_widgets[old_incident_idx].configure(fg_color="transparent")
-
-        # Add new highlight
-        if new_index >= 0 and new_index < len(self.current_search_results):
-            new_incident_idx = self.current_search_results[new_index]
-            if new_incident_idx < len(self.active_widgets):
-                self.active_widgets[new_incident_idx].configure(fg_color="yellow")
-
     def clear_incidents(self) -> None:
         """Clear all incidents from the viewer."""
-        # Clear the display
-        for widget in self.incident_listbox.winfo_children():
+        self._finish_search()
+
+        # Clear the display; every row, shown or pooled, is a canvas child
+        for widget in self._canvas.winfo_children():
             widget.destroy()
+        self._canvas.delete("all")
+        self.active_widgets = {}
+        self.widget_pool = deque()
+        self.shown_incidents = []
+        self._row_height = None
+        self._canvas.configure(scrollregion=(0, 0, 0, 0))
 
         # Clear stored data
         self.all_incidents = []
+        self.search_index = {}
+        self._lower_text = []
+        self._trigram_index = {}
+        self._query_cache.clear()
+        self._last_search = None
+        self._last_result = []
         self.current_search_results = []
         self.current_occurrence_index = 0
 
@@ -443,15 +825,21 @@ class IncidentViewer(ctk.CTkFrame):
         if self.search_var:
             self.search_var.set("")
 
-        self.search_mode = "text"
+        # Clearing the box schedules a search; nothing is left to search
+        self._cancel_search_timer()
+        self._cancel_occurrence_view()
+        self._last_query = None
+        self._highlighted_index = None
 
-        if hasattr(self, "active_widgets"):
-            self.active_widgets = []
+        self.search_mode = "text"
 
-        if hasattr(self, "widget_pool"):
-            for widget in self.widget_pool:
-                widget.destroy()
-            self.widget_pool = []
+    def destroy(self) -> None:
+        """Cancel pending search and highlight callbacks before destroying."""
+        self._cancel_search_timer()
+        self._cancel_occurrence_view()
+        self._discard_search()
+        self._search_executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
 
     def set_callback(self, event_name: str, callback: Callable) -> None:
         """
@@ -1,5 +1,7 @@
 """Graph presets component."""
 
+from itertools import chain
+
 import customtkinter as ctk
 from typing import Callable, List, Dict
 
@@ -16,6 +18,9 @@ class PresetGraph(ctk.CTkFrame):
         self.callbacks = {}
         self.checkboxes = []
 
+        # Preset names in display order, without "All"
+        self._preset_keys = tuple(GRAPH_PRESETS)
+
         self.setup_component()
 
     def setup_component(self):
@@ -32,21 +37,13 @@ class PresetGraph(ctk.CTkFrame):
         componenet_listbox.grid_columnconfigure(0, weight=1)
         componenet_listbox.grid_columnconfigure(1, weight=1)
 
-        row = 0
-        col = 0
-
-        # Create checkbox to select all presets
-        all_presets_var = ctk.StringVar(value="off")
-        self.state["All"] = all_presets_var
-        all_presets_checkbox = ctk.CTkCheckBox(
-            componenet_listbox,
-            text="All",
+        # One font and one set of options shared by every checkbox
+        checkbox_options = dict(
             font=ctk.CTkFont(family="Inter", size=14, weight="bold"),
             width=18,
             height=18,
             checkbox_width=16,
             checkbox_height=16,
-            variable=all_presets_var,
             onvalue="on",
             offvalue="off",
             fg_color=UI_COLORS["checkbox"],
@@ -55,42 +52,23 @@ class PresetGraph(ctk.CTkFrame):
             border_width=1,
             text_color=UI_COLORS["white"],
         )
-        all_presets_checkbox.grid(
-            row=row,
-            column=col,
-            padx=UI_PADDING["small"],
-            pady=UI_PADDING["small"],
-            sticky="ew",
-        )
-        col += 1
 
-        self.checkboxes.append(all_presets_checkbox)
-
-        # Populate frame with presets
-        for key, value in GRAPH_PRESETS.items():
+        # Checkbox to select all presets, then one per preset
+        for index, key in enumerate(chain(("All",), GRAPH_PRESETS)):
             preset_var = ctk.StringVar(value="off")
             self.state[key] = preset_var
 
             preset_checkbox = ctk.CTkCheckBox(
                 componenet_listbox,
                 text=key,
-                font=ctk.CTkFont(family="Inter", size=14, weight="bold"),
-                width=18,
-                height=18,
-                checkbox_width=16,
-                checkbox_height=16,
                 variable=preset_var,
-                onvalue="on",
-                offvalue="off",
-                fg_color=UI_COLORS["checkbox"],
-                hover_color=UI_COLORS["checkbox_hover"],
-                corner_radius=3,
-                border_width=1,
-                text_color=UI_COLORS["white"],
+                **checkbox_options,
             )
+
+            # Fill two columns, wrapping to the next row
             preset_checkbox.grid(
-                row=row,
-                column=col,
+                row=index // 2,
+                column=index % 2,
                 padx=UI_PADDING["small"],
                 pady=UI_PADDING["small"],
                 sticky="ew",
@@ -98,12 +76,6 @@ class PresetGraph(ctk.CTkFrame):
 
             self.checkboxes.append(preset_checkbox)
 
-            # Move to next column, wrap to next row after 3 columns
-            col += 1
-            if col >= 2:
-                col = 0
-                row += 1
-
     def clear(self) -> None:
         """Clear all selected checboxes."""
 
@@ -122,9 +94,10 @@ class PresetGraph(ctk.CTkFrame):
 
         # Check if all is selected
         if self.state["All"].get() == "on":
-            return [key for key in self.state.keys() if key != "All"]
+            return list(self._preset_keys)
         else:
-            return [key for key, var in self.state.items() if var.get() == "on"]
+            state = self.state
+            return [key for key in self._preset_keys if state[key].get() == "on"]
 
     def set_callback(self, event_name: str, callback: Callable) -> None:
         """
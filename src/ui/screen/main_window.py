@@ -1122,7 +1122,14 @@ class MainWindow:
         date_label = self.components["incident"]["report"]["date"]
         time_label = self.components["incident"]["report"]["time"]
 
-        return {"serial_num": serial_num_label, "date": date_label, "time": time_label}
+        selected_files = self.components["file_selector"].get_selected_files()
+
+        return {
+            "files": selected_files,
+            "serial_num": serial_num_label,
+            "date": date_label,
+            "time": time_label,
+        }
 
     def collect_incident_parameters(self) -> dict:
         """
@@ -9,7 +9,7 @@ import glob
 
 import lz4.frame
 
-from config.constants import BATCH_SIZE, DATA_FOLDER_PATH
+from config.constants import get_data_folder_path
 
 
 def get_unique_folder(path: str) -> str:
@@ -119,7 +119,7 @@ def decompress_datadownload(file_paths: List[str]) -> bool:
             with open(file, "rb") as f:
                 with lz4.frame.open(f, mode="rb") as extracted_file:
                     with tarfile.open(fileobj=extracted_file, mode="r|") as tar:
-                        tar.extractall(path=DATA_FOLDER_PATH)
+                        tar.extractall(path=get_data_folder_path())
         return True
     except Exception as e:
         pass
@@ -145,11 +145,15 @@ def merge_batch(
         with sqlite3.connect(target_database) as database_connection:
             database_cursor = database_connection.cursor()
 
-            # Set the target database to use WAL mode
-            try:
-                database_cursor.execute("PRAGMA journal_mode=WAL")
-            except sqlite3.OperationalError as e:
-                pass  # Add logic later
+            # Larger pages suit the bulk inserts and later full-table scans;
+            # only takes effect while the target database is still empty
+            database_cursor.execute("PRAGMA page_size=32768")
+
+            # The merged file is rebuilt from the sources if a merge fails, so
+            # copy without fsyncs and keep the rollback journal in memory.
+            # WAL is switched on after the copy so rows aren't written twice
+            database_cursor.execute("PRAGMA journal_mode=MEMORY")
+            database_cursor.execute("PRAGMA synchronous=OFF")
 
             # Attach the first source database to copy schema
             alias = "source_temp"
@@ -231,6 +235,9 @@ def merge_batch(
                         # Used to filter out blank entries between databases
                         pass
 
+                # A source can't be detached inside the open transaction
+                database_connection.commit()
+
                 # Detach the source database
                 try:
                     database_cursor.execute(f"DETACH DATABASE {alias}")
@@ -238,6 +245,13 @@ def merge_batch(
                     pass  # Add logic later
 
             database_connection.commit()
+
+            # Set the target database to use WAL mode
+            try:
+                database_cursor.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.OperationalError as e:
+                pass  # Add logic later
+
             return True
 
     except Exception as e:
@@ -256,24 +270,12 @@ def merge_database_files(file_paths: List[str]) -> bool:
       bool: True if merging successful, False otherwise
     """
     try:
-        target_database = os.path.join(DATA_FOLDER_PATH, "merged_db.sqlite")
-
-        # Process database files in batches of 9 (SQLITE3 limit is 10)
-        for i in range(0, len(file_paths), BATCH_SIZE):
-            current_batch = file_paths[i : i + BATCH_SIZE]
-            temp_target_database = (
-                target_database
-                if i == 0
-                else os.path.join(DATA_FOLDER_PATH, f"temp_merge_{i}.sqlite")
-            )
-
-            # Merging logic
-            merge_batch(current_batch, temp_target_database)
-            if i > 0:
-                # Merge temp database into target database
-                merge_batch(
-                    [temp_target_database], target_database, create_tables=False
-                )
+        target_database = os.path.join(get_data_folder_path(), "merged_db.sqlite")
+
+        # merge_batch commits and detaches each source before attaching the
+        # next, so SQLite's limit of 10 attached databases never applies; copy
+        # every file straight into the target instead of through temp_merge files
+        merge_batch(file_paths, target_database)
         return True
 
     except Exception as e:
@@ -284,8 +286,8 @@ def merge_database_files(file_paths: List[str]) -> bool:
 def get_database_filepaths() -> List[str]:
     """Get the file paths of valid databases in DDT Data directory."""
     return [
-        os.path.join(DATA_FOLDER_PATH, filename)
-        for filename in os.listdir(DATA_FOLDER_PATH)
+        os.path.join(get_data_folder_path(), filename)
+        for filename in os.listdir(get_data_folder_path())
         if "FB20.DC" in filename
     ]
 
@@ -296,12 +298,12 @@ def cleanup_data_directory() -> bool:
     DELETES:
     *.db
     """
-    pattern = os.path.join(DATA_FOLDER_PATH, "*.db")
+    pattern = os.path.join(get_data_folder_path(), "*.db")
     db_files = glob.glob(pattern)
 
     for db_file in db_files:
         try:
-            if db_file != os.path.join(DATA_FOLDER_PATH, "fbhmi.db"):
+            if db_file != os.path.join(get_data_folder_path(), "fbhmi.db"):
                 os.remove(db_file)
         except OSError as e:
             pass
@@ -318,7 +320,7 @@ def get_xml_file() -> str:
         str: Path to text dic or None if not found
     """
 
-    pattern = os.path.join(DATA_FOLDER_PATH, "*textDic*")
+    pattern = os.path.join(get_data_folder_path(), "*textDic*")
     text_dic = glob.glob(pattern)
 
     if text_dic[0]:
@@ -21,8 +21,8 @@ from bokeh.io import curdoc
 import numpy as np
 from bs4 import BeautifulSoup
 
-from config.chart_config import CHART_COLORS
-from config.constants import DATA_FOLDER_PATH, SCREENSIZE
+from config.chart_config import chart_color_iter
+from config.constants import get_data_folder_path, get_screensize
 from viz.plot_point import PlotPoint
 
 
@@ -62,7 +62,7 @@ class GraphGenerator:
             self._create_single_plot(graph_name, graph_data)
 
     def _create_single_plot(
-        self, plot_name: str, plot_data: Dict[str, List[Dict[str, Any]]]
+        self, plot_name: str, plot_data: Dict[str, Dict[str, np.ndarray]]
     ) -> bool:
         """
         Create a bokeh plot.
@@ -81,20 +81,21 @@ class GraphGenerator:
         renderers["asterick"] = {}
 
         # Create bokeh figure
+        width, height = get_screensize()
         plot = figure(
             title=plot_name,
             x_axis_label="Time",
             y_axis_label="Value",
             x_axis_type="datetime",
-            width=SCREENSIZE[0],
-            height=SCREENSIZE[1],
+            width=width,
+            height=height,
         )
 
         # Process each points data
-        for i, (point_name, time_value_list) in enumerate(plot_data.items()):
+        for (point_name, series), color in zip(plot_data.items(), chart_color_iter()):
 
             # Filter data
-            x_values, y_values = self._filter_valid_data(time_value_list)
+            x_values, y_values = self._filter_valid_data(series)
 
             # Plot point
             plot_point = PlotPoint(
@@ -102,7 +103,7 @@ class GraphGenerator:
                 plot,
                 x_values,
                 y_values,
-                CHART_COLORS[i % len(CHART_COLORS)],
+                color,
             )
 
             # Add to renderers
@@ -156,15 +157,12 @@ class GraphGenerator:
         )
         plot.add_layout(label_annotation)
 
-    def _filter_valid_data(self, time_value_list: Dict):
+    def _filter_valid_data(self, series: Dict[str, np.ndarray]):
         """Filter out Nan (empty) values in data."""
 
-        # Convert data to numpy array for bokeh
-        timestamps, values = zip(
-            *[(entry["timestamp"], entry["value"]) for entry in time_value_list]
-        )
-        x_values = np.array(timestamps)
-        y_values = np.array(values).astype(np.double)
+        # Stored as arrays already, only the values need a float view for bokeh
+        x_values = series["timestamp"]
+        y_values = series["value"].astype(np.double)
 
         # Create mask for y-values
         mask = np.isfinite(y_values)
@@ -273,13 +271,13 @@ class GraphGenerator:
         layout = column(
             self.custom_css_div, plot, row(self.checkboxes, self.toggle_symbols_btn)
         )
-        output_file(f"{DATA_FOLDER_PATH}/{name}.html")
+        output_file(f"{get_data_folder_path()}/{name}.html")
         save(layout)
 
     def _modify_html(self, plot_name: str):
         """Post processing of HTML file with Beautiful Soup."""
         with open(
-            DATA_FOLDER_PATH + "\\" + plot_name + ".html", "r", encoding="utf-8"
+            get_data_folder_path() + "\\" + plot_name + ".html", "r", encoding="utf-8"
         ) as plot_file:
             soup = BeautifulSoup(plot_file, "html.parser")
 
@@ -294,10 +292,10 @@ class GraphGenerator:
                 title.string = plot_name
 
         with open(
-            DATA_FOLDER_PATH + "\\" + plot_name + ".html", "w", encoding="utf-8"
+            get_data_folder_path() + "\\" + plot_name + ".html", "w", encoding="utf-8"
         ) as plot_file:
             plot_file.write(str(soup))
 
     def _open_plot(self, plot_name):
         """Open plot in browser."""
-        os.startfile(DATA_FOLDER_PATH + "\\" + plot_name + ".html")
+        os.startfile(get_data_folder_path() + "\\" + plot_name + ".html")